@@ -3,59 +3,69 @@
 Extracts X-Trace-Id header from requests or generates UUID v4.
 """
 
-import uuid
-from typing import Awaitable, Callable
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+
+from docling_service.core.ids import new_trace_id
 
 logger = structlog.get_logger(__name__)
 
 
-class TraceContextMiddleware(BaseHTTPMiddleware):
-    """Middleware for extracting and propagating trace context.
+class TraceContextMiddleware:
+    """Pure ASGI middleware for extracting and propagating trace context.
 
     Extracts X-Trace-Id header from incoming requests. If not present,
     generates a new UUID v4 trace ID. Binds the trace ID to structlog
     context for the duration of the request.
-    """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        """Process request with trace context.
+    Implemented as a plain ASGI callable (not BaseHTTPMiddleware) to avoid
+    the per-request Request/Response wrapping and anyio stream overhead on
+    a path that only reads one header.
+    """
 
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
+    def __init__(self, app: Callable[..., Awaitable[None]]) -> None:
+        self.app = app
 
-        Returns:
-            HTTP response with X-Trace-Id header
-        """
-        # Extract or generate trace ID
-        trace_id = request.headers.get("X-Trace-Id") or str(uuid.uuid4())
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        """Process request with trace context."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Extract or generate trace ID from raw ASGI headers
+        trace_id = next(
+            (value.decode("latin-1") for name, value in scope["headers"] if name == b"x-trace-id"),
+            None,
+        ) or new_trace_id()
 
         # Store in request state for access in route handlers
-        request.state.trace_id = trace_id
-
-        # Bind to structlog context for automatic inclusion in logs
-        structlog.contextvars.bind_contextvars(trace_id=trace_id)
+        scope.setdefault("state", {})["trace_id"] = trace_id
 
-        try:
-            # Process request
-            response = await call_next(request)
+        trace_id_bytes = trace_id.encode("latin-1")
 
-            # Add trace ID to response headers
-            response.headers["X-Trace-Id"] = trace_id
+        async def send_with_trace_id(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"].append((b"x-trace-id", trace_id_bytes))
+            await send(message)
 
-            return response
+        # Bind to structlog context for automatic inclusion in logs. Binding
+        # happens in the same task that runs the app (pure ASGI), so the
+        # contextvar is always visible to route handlers; resetting via the
+        # bind tokens restores the prior context without a dict rewrite.
+        tokens = structlog.contextvars.bind_contextvars(trace_id=trace_id)
 
+        try:
+            await self.app(scope, receive, send_with_trace_id)
         finally:
-            # Clear context after request
-            structlog.contextvars.unbind_contextvars("trace_id")
+            structlog.contextvars.reset_contextvars(**tokens)
 
 
 def get_trace_id_from_request(request: Request) -> str:
@@ -67,4 +77,4 @@ def get_trace_id_from_request(request: Request) -> str:
     Returns:
         Trace ID from request state or generates new one
     """
-    return getattr(request.state, "trace_id", None) or str(uuid.uuid4())
+    return getattr(request.state, "trace_id", None) or new_trace_id()
@@ -3,12 +3,18 @@
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared config: payloads are fixed contracts, so unknown fields are dropped
+# rather than stored, and instances are immutable once built.
+_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, populate_by_name=True)
 
 
 class ProcessingOptions(BaseModel):
     """Optional per-job configuration overrides."""
 
+    model_config = _MODEL_CONFIG
+
     processing_tier: Literal["lightweight", "standard", "advanced"] | None = Field(
         default=None,
         description="Override the default processing tier",
@@ -29,11 +35,17 @@ class ProcessingOptions(BaseModel):
         default=None,
         description="Override calculated timeout",
     )
+    queue_priority: Literal["standard", "batch"] = Field(
+        default="standard",
+        description="'batch' grants longer timeouts to latency-tolerant jobs (e.g. nightly backfills)",
+    )
 
 
 class ProcessRequest(BaseModel):
     """Request to process a single document."""
 
+    model_config = _MODEL_CONFIG
+
     file_path: str = Field(
         ...,
         description="Absolute path to the document file",
@@ -47,6 +59,8 @@ class ProcessRequest(BaseModel):
 class BatchProcessRequest(BaseModel):
     """Request to process multiple documents."""
 
+    model_config = _MODEL_CONFIG
+
     file_paths: list[str] = Field(
         ...,
         description="Array of absolute paths to document files",
@@ -60,6 +74,8 @@ class BatchProcessRequest(BaseModel):
 class ProcessResponse(BaseModel):
     """Response after queuing a document for processing."""
 
+    model_config = _MODEL_CONFIG
+
     job_id: str = Field(..., description="Unique identifier for tracking the job")
     status: str = Field(default="queued", description="Initial job status")
     message: str = Field(default="Document queued for processing")
@@ -69,6 +85,8 @@ class ProcessResponse(BaseModel):
 class BatchProcessResponse(BaseModel):
     """Response after queuing multiple documents for processing."""
 
+    model_config = _MODEL_CONFIG
+
     job_ids: list[str] = Field(..., description="UUIDs for each submitted document")
     status: str = Field(default="queued", description="Initial status")
     total_documents: int = Field(..., description="Number of documents submitted")
@@ -79,6 +97,8 @@ class BatchProcessResponse(BaseModel):
 class ProcessingMetadata(BaseModel):
     """Metadata about a processing job."""
 
+    model_config = _MODEL_CONFIG
+
     page_count: int | None = Field(default=None, description="Total pages in document")
     file_path: str | None = Field(default=None, description="Original file path")
     processing_tier: str | None = Field(default=None, description="Tier used for processing")
@@ -90,6 +110,8 @@ class ProcessingMetadata(BaseModel):
 class ProcessingResult(BaseModel):
     """Result of a successful document processing job."""
 
+    model_config = _MODEL_CONFIG
+
     status: Literal["success", "error"] = Field(..., description="Processing status")
     markdown: str | None = Field(default=None, description="Page-annotated Markdown content")
     metadata: ProcessingMetadata | None = Field(default=None, description="Processing statistics")
@@ -99,6 +121,8 @@ class ProcessingResult(BaseModel):
 class JobStatus(BaseModel):
     """Status of a processing job."""
 
+    model_config = _MODEL_CONFIG
+
     job_id: str = Field(..., description="Job identifier")
     file_path: str = Field(..., description="Path to the input document")
     status: Literal["queued", "processing", "completed", "failed", "cancelled"] = Field(
@@ -117,6 +141,8 @@ class JobStatus(BaseModel):
 class HealthResponse(BaseModel):
     """API health check response."""
 
+    model_config = _MODEL_CONFIG
+
     status: Literal["healthy", "unhealthy"] = Field(..., description="Service health status")
     version: str = Field(..., description="Service version")
     processing_tier: str = Field(..., description="Default processing tier")
@@ -128,5 +154,7 @@ class HealthResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Error response model."""
 
+    model_config = _MODEL_CONFIG
+
     detail: str = Field(..., description="Error message")
     trace_id: str | None = Field(default=None, description="Trace ID for log correlation")
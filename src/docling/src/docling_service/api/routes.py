@@ -1,10 +1,13 @@
 """API routes with authentication middleware for Docling Service."""
 
-import uuid
+import hmac
+import os
+from pathlib import PurePath
 from typing import Annotated
 
 import structlog
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from docling_service.api.models import (
@@ -13,12 +16,11 @@ from docling_service.api.models import (
     ErrorResponse,
     HealthResponse,
     JobStatus,
-    ProcessingMetadata,
-    ProcessingResult,
     ProcessRequest,
     ProcessResponse,
 )
 from docling_service.core.config import settings
+from docling_service.core.ids import new_trace_id
 from docling_service.core.queue import job_queue
 
 logger = structlog.get_logger(__name__)
@@ -29,6 +31,36 @@ router = APIRouter()
 # Bearer token authentication
 security = HTTPBearer(auto_error=False)
 
+# Constant health-check fields, built once at import time. Responses below are
+# built with model_construct() or returned as pre-serialized ORJSONResponse:
+# every field is server-generated (never user-controlled), so Pydantic
+# validation adds cost without adding safety.
+_HEALTH_CONST = {"status": "healthy", "version": "0.1.0"}
+
+# Shared sentinel for requests without options; enqueue() copies falsy values.
+_EMPTY_OPTS: dict = {}
+
+# Document formats accepted for processing
+_VALID_SUFFIXES = frozenset({".pdf", ".docx", ".xlsx", ".pptx", ".html", ".md", ".txt"})
+
+
+def _validate_file_path(file_path: str) -> None:
+    """Reject obviously invalid paths before they reach a worker.
+
+    Only cheap, synchronous checks run here (absolute path, supported
+    suffix); existence is still checked by the worker so that files being
+    staged while queued are not rejected prematurely.
+
+    Raises:
+        HTTPException: If the path is relative or has an unsupported suffix
+    """
+    if not os.path.isabs(file_path) or PurePath(file_path).suffix.lower() not in _VALID_SUFFIXES:
+        logger.warning("invalid_file_path_rejected", file_path=file_path)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid file path: {file_path}",
+        )
+
 
 async def verify_auth_token(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
@@ -56,7 +88,8 @@ async def verify_auth_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    if credentials.credentials != settings.auth_token:
+    # Constant-time comparison; a plain != leaks token prefix length via timing
+    if not hmac.compare_digest(credentials.credentials.encode(), settings.auth_token.encode()):
         logger.warning("auth_invalid_token")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -67,18 +100,25 @@ async def verify_auth_token(
     return credentials.credentials
 
 
-def get_trace_id(
-    x_trace_id: Annotated[str | None, Header(alias="X-Trace-Id")] = None,
-) -> str:
+def get_trace_id(request: Request) -> str:
     """Extract or generate trace ID for request correlation.
 
+    TraceContextMiddleware already resolved the trace ID and stored it on the
+    ASGI scope state, so the common path is a single dict lookup. The header
+    fallback covers apps mounted without the middleware (e.g. tests).
+
     Args:
-        x_trace_id: Trace ID from X-Trace-Id header
+        request: Incoming HTTP request
 
     Returns:
-        Trace ID (from header or newly generated UUID v4)
+        Trace ID (from middleware state, header, or newly generated UUID v4)
     """
-    return x_trace_id or str(uuid.uuid4())
+    state = request.scope.get("state")
+    if state is not None:
+        trace_id = state.get("trace_id")
+        if trace_id:
+            return trace_id
+    return request.headers.get("x-trace-id") or new_trace_id()
 
 
 @router.get(
@@ -89,25 +129,25 @@ def get_trace_id(
 )
 async def health_check(
     trace_id: Annotated[str, Depends(get_trace_id)],
-) -> HealthResponse:
+) -> ORJSONResponse:
     """Return service health status."""
-    log = logger.bind(trace_id=trace_id)
-    log.debug("health_check_requested")
-
-    return HealthResponse(
-        status="healthy",
-        version="0.1.0",
-        processing_tier=settings.processing_tier,
-        queue_size=job_queue.size(),
-        active_jobs=job_queue.active_count(),
-        trace_id=trace_id,
+    logger.debug("health_check_requested")
+
+    return ORJSONResponse(
+        {
+            **_HEALTH_CONST,
+            "processing_tier": settings.processing_tier,
+            "queue_size": job_queue.size(),
+            "active_jobs": job_queue.active_count(),
+            "trace_id": trace_id,
+        }
     )
 
 
 @router.post(
     "/process",
     response_model=ProcessResponse,
-    responses={401: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
     summary="Process a single document",
     description="Queue a document for processing and return job ID",
     dependencies=[Depends(verify_auth_token)],
@@ -125,19 +165,12 @@ async def process_document(
     Returns:
         Response with job ID for status polling
     """
-    log = logger.bind(trace_id=trace_id, file_path=request.file_path)
-    log.info("process_request_received")
-
-    # Prepare options dict
-    options = {}
-    if request.options:
-        options = {
-            "processing_tier": request.options.processing_tier,
-            "languages": request.options.languages,
-            "force_full_page_ocr": request.options.force_full_page_ocr,
-            "include_page_markers": request.options.include_page_markers,
-            "timeout_seconds": request.options.timeout_seconds,
-        }
+    logger.info("process_request_received", file_path=request.file_path)
+
+    _validate_file_path(request.file_path)
+
+    # model_dump runs in pydantic-core (Rust) and stays in sync as fields evolve
+    options = request.options.model_dump(exclude_none=True) if request.options else _EMPTY_OPTS
 
     # Enqueue job
     job_id = await job_queue.enqueue(
@@ -146,9 +179,9 @@ async def process_document(
         trace_id=trace_id,
     )
 
-    log.info("process_request_queued", job_id=job_id)
+    logger.info("process_request_queued", job_id=job_id, file_path=request.file_path)
 
-    return ProcessResponse(
+    return ProcessResponse.model_construct(
         job_id=job_id,
         status="queued",
         message="Document queued for processing",
@@ -159,7 +192,7 @@ async def process_document(
 @router.post(
     "/process/batch",
     response_model=BatchProcessResponse,
-    responses={401: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    responses={400: {"model": ErrorResponse}, 401: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
     summary="Process multiple documents",
     description="Queue multiple documents for batch processing",
     dependencies=[Depends(verify_auth_token)],
@@ -177,41 +210,32 @@ async def process_batch(
     Returns:
         Response with job IDs for each document
     """
-    log = logger.bind(trace_id=trace_id, file_count=len(request.file_paths))
-    log.info("batch_request_received")
+    logger.info("batch_request_received", file_count=len(request.file_paths))
+
+    for file_path in request.file_paths:
+        _validate_file_path(file_path)
 
     # Generate correlation ID for batch
-    correlation_id = str(uuid.uuid4())
-
-    # Prepare options dict
-    options = {}
-    if request.options:
-        options = {
-            "processing_tier": request.options.processing_tier,
-            "languages": request.options.languages,
-            "force_full_page_ocr": request.options.force_full_page_ocr,
-            "include_page_markers": request.options.include_page_markers,
-            "timeout_seconds": request.options.timeout_seconds,
-        }
+    correlation_id = new_trace_id()
 
-    # Enqueue all jobs
-    job_ids = []
-    for file_path in request.file_paths:
-        job_id = await job_queue.enqueue(
-            file_path=file_path,
-            options=options,
-            trace_id=trace_id,
-            correlation_id=correlation_id,
-        )
-        job_ids.append(job_id)
+    # model_dump runs in pydantic-core (Rust) and stays in sync as fields evolve
+    options = request.options.model_dump(exclude_none=True) if request.options else _EMPTY_OPTS
 
-    log.info(
+    # Bulk enqueue: one pass over the batch instead of one await per file
+    job_ids = await job_queue.enqueue_many(
+        request.file_paths,
+        options=options,
+        trace_id=trace_id,
+        correlation_id=correlation_id,
+    )
+
+    logger.info(
         "batch_request_queued",
         job_count=len(job_ids),
         correlation_id=correlation_id,
     )
 
-    return BatchProcessResponse(
+    return BatchProcessResponse.model_construct(
         job_ids=job_ids,
         status="queued",
         total_documents=len(job_ids),
@@ -230,13 +254,14 @@ async def process_batch(
 )
 async def get_job_status(
     job_id: str,
-    trace_id: Annotated[str, Depends(get_trace_id)],
-) -> JobStatus:
+) -> ORJSONResponse:
     """Get status of a specific job.
 
+    Trace correlation is handled by TraceContextMiddleware (response
+    header + structlog contextvar), so no trace_id dependency is needed.
+
     Args:
         job_id: Job identifier
-        trace_id: Trace ID for log correlation
 
     Returns:
         Job status including progress and result
@@ -244,42 +269,19 @@ async def get_job_status(
     Raises:
         HTTPException: If job not found
     """
-    log = logger.bind(trace_id=trace_id, job_id=job_id)
-    log.debug("job_status_requested")
+    logger.debug("job_status_requested", job_id=job_id)
 
     job_data = job_queue.get_job(job_id)
     if not job_data:
-        log.warning("job_not_found")
+        logger.warning("job_not_found", job_id=job_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job not found: {job_id}",
         )
 
-    # Convert job data to JobStatus response
-    result = None
-    if job_data.get("result"):
-        result = ProcessingResult(
-            status=job_data["result"].get("status", "error"),
-            markdown=job_data["result"].get("markdown"),
-            metadata=ProcessingMetadata(**job_data["result"].get("metadata", {}))
-            if job_data["result"].get("metadata")
-            else None,
-            error=job_data["result"].get("error"),
-        )
-
-    return JobStatus(
-        job_id=job_data["job_id"],
-        file_path=job_data["file_path"],
-        status=job_data["status"],
-        progress=job_data["progress"],
-        result=result,
-        error=job_data["error"],
-        error_type=job_data["error_type"],
-        created_at=job_data["created_at"],
-        started_at=job_data["started_at"],
-        completed_at=job_data["completed_at"],
-        trace_id=job_data["trace_id"],
-    )
+    # Job dicts already match the JobStatus schema; serialize them directly
+    # instead of round-tripping through Pydantic model construction.
+    return ORJSONResponse(job_data)
 
 
 @router.get(
@@ -289,52 +291,20 @@ async def get_job_status(
     description="Get status of all processing jobs",
     dependencies=[Depends(verify_auth_token)],
 )
-async def list_jobs(
-    trace_id: Annotated[str, Depends(get_trace_id)],
-) -> list[JobStatus]:
+async def list_jobs() -> ORJSONResponse:
     """List all jobs.
 
-    Args:
-        trace_id: Trace ID for log correlation
+    Trace correlation is handled by TraceContextMiddleware (response
+    header + structlog contextvar), so no trace_id dependency is needed.
 
     Returns:
         List of job statuses
     """
-    log = logger.bind(trace_id=trace_id)
-    log.debug("jobs_list_requested")
-
-    jobs_data = job_queue.list_jobs()
-    result = []
-
-    for job_data in jobs_data:
-        job_result = None
-        if job_data.get("result"):
-            job_result = ProcessingResult(
-                status=job_data["result"].get("status", "error"),
-                markdown=job_data["result"].get("markdown"),
-                metadata=ProcessingMetadata(**job_data["result"].get("metadata", {}))
-                if job_data["result"].get("metadata")
-                else None,
-                error=job_data["result"].get("error"),
-            )
-
-        result.append(
-            JobStatus(
-                job_id=job_data["job_id"],
-                file_path=job_data["file_path"],
-                status=job_data["status"],
-                progress=job_data["progress"],
-                result=job_result,
-                error=job_data["error"],
-                error_type=job_data["error_type"],
-                created_at=job_data["created_at"],
-                started_at=job_data["started_at"],
-                completed_at=job_data["completed_at"],
-                trace_id=job_data["trace_id"],
-            )
-        )
+    logger.debug("jobs_list_requested")
 
-    return result
+    # Job dicts already match the JobStatus schema; serialize them directly
+    # instead of building N Pydantic models for FastAPI to re-walk.
+    return ORJSONResponse(job_queue.list_jobs())
 
 
 @router.delete(
@@ -361,8 +331,7 @@ async def cancel_job(
     Raises:
         HTTPException: If job not found or cannot be cancelled
     """
-    log = logger.bind(trace_id=trace_id, job_id=job_id)
-    log.info("job_cancel_requested")
+    logger.info("job_cancel_requested", job_id=job_id)
 
     cancelled = await job_queue.cancel(job_id)
     if not cancelled:
@@ -377,5 +346,5 @@ async def cancel_job(
             detail=f"Cannot cancel job in state: {job_data['status']}",
         )
 
-    log.info("job_cancelled")
+    logger.info("job_cancelled", job_id=job_id)
     return {"status": "cancelled", "job_id": job_id, "trace_id": trace_id}
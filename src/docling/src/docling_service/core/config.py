@@ -1,5 +1,7 @@
 """Configuration management for Docling Service."""
 
+import functools
+import os
 from typing import Literal
 
 from pydantic import Field
@@ -17,6 +19,10 @@ class Settings(BaseSettings):
     # Server configuration
     host: str = Field(default="127.0.0.1", description="Host to bind to")
     port: int = Field(default=8001, description="Port to listen on")
+    event_loop: Literal["auto", "uvloop", "asyncio"] = Field(
+        default="auto",
+        description="Event loop implementation ('auto' picks uvloop when installed)",
+    )
 
     # Authentication
     auth_token: str | None = Field(default=None, description="Shared secret for authentication")
@@ -32,6 +38,11 @@ class Settings(BaseSettings):
         le=3,
         description="Maximum number of concurrent processing jobs",
     )
+    max_job_history: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum number of jobs retained in history before old finished jobs are evicted",
+    )
 
     # Directories
     temp_dir: str | None = Field(
@@ -39,6 +50,18 @@ class Settings(BaseSettings):
         description="Temporary directory for processing files",
     )
 
+    # Memory observability (RSS reads parse /proc per call, so sampling is
+    # off by default and rate-limited when enabled)
+    memory_logging_enabled: bool = Field(
+        default=False,
+        description="Log process RSS around job execution",
+    )
+    memory_logging_interval_s: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Minimum seconds between RSS samples when memory logging is enabled",
+    )
+
     # Timeout configuration (formula: base + page_count * per_page * tier_multiplier)
     timeout_base_seconds: int = Field(default=60, description="Base timeout in seconds")
     timeout_per_page_seconds: int = Field(default=10, description="Additional timeout per page")
@@ -47,8 +70,56 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", description="Logging level")
 
 
+@functools.cache
+def _settings_for(env_fingerprint: tuple[tuple[str, str], ...]) -> Settings:  # noqa: ARG001
+    """Construct Settings once per distinct DOCLING_* environment.
+
+    env_fingerprint is only the cache key; Settings() reads the live
+    environment itself.
+    """
+    return Settings()
+
+
+def get_settings() -> Settings:
+    """Return a Settings instance cached on the current environment.
+
+    Repeat calls under an unchanged DOCLING_* environment skip pydantic's
+    env parsing and field validation entirely; callers that need a
+    guaranteed-fresh instance (e.g. env-parsing tests) construct Settings()
+    directly.
+    """
+    # Settings is case_sensitive=False, so match the filter: a lowercase
+    # docling_port=... is honored by pydantic-settings and must show up in
+    # the cache key too
+    fingerprint = tuple(
+        sorted(item for item in os.environ.items() if item[0].upper().startswith("DOCLING_"))
+    )
+    return _settings_for(fingerprint)
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
+
+# Tier multipliers scaled by 2 so calculate_timeout stays in integer math
+# (lightweight 0.5x, standard 1.0x, advanced 2.0x).
+_TIER_MULT_X2 = {
+    "lightweight": 1,
+    "standard": 2,
+    "advanced": 4,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _timeout_for(page_count: int, tier: str) -> int:
+    """Cached timeout for a resolved (page_count, tier) pair.
+
+    The timeout settings are fixed for the lifetime of the process, so the
+    result is invariant and the queue's per-job call becomes a dict lookup.
+    """
+    multiplier_x2 = _TIER_MULT_X2.get(tier, 2)
+    return (
+        (settings.timeout_base_seconds + page_count * settings.timeout_per_page_seconds) * multiplier_x2 // 2
+    )
 
 
 def calculate_timeout(page_count: int, tier: str | None = None) -> int:
@@ -61,15 +132,6 @@ def calculate_timeout(page_count: int, tier: str | None = None) -> int:
     Returns:
         Timeout in seconds
     """
-    tier_multipliers = {
-        "lightweight": 0.5,
-        "standard": 1.0,
-        "advanced": 2.0,
-    }
-
-    effective_tier = tier or settings.processing_tier
-    multiplier = tier_multipliers.get(effective_tier, 1.0)
-
-    return int(
-        (settings.timeout_base_seconds + (page_count * settings.timeout_per_page_seconds)) * multiplier
-    )
+    # Resolve the tier before hitting the cache so a None tier tracks the
+    # settings default instead of freezing it into a cache entry
+    return _timeout_for(page_count, tier or settings.processing_tier)
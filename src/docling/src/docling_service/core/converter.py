@@ -4,7 +4,8 @@ IMPORTANT: EasyOCR configuration order sensitivity - set ocr_options LAST
 in pipeline configuration to avoid overwriting other OCR settings.
 """
 
-import logging
+import asyncio
+import random
 import time
 from pathlib import Path
 from typing import Any
@@ -16,12 +17,24 @@ from docling_service.utils.markdown import generate_page_annotated_markdown
 
 logger = structlog.get_logger(__name__)
 
+# Converter cache keyed by (tier, languages, force_full_page_ocr). Building a
+# converter loads OCR models, so only the first job per configuration pays
+# that cost; subsequent jobs reuse the cached instance.
+_CONVERTERS: dict[tuple[str, tuple[str, ...], bool], Any] = {}
+_CONV_LOCK = asyncio.Lock()
 
-def create_converter(processing_tier: str = "standard") -> Any:
+
+def create_converter(
+    processing_tier: str = "standard",
+    languages: list[str] | None = None,
+    force_full_page_ocr: bool = False,
+) -> Any:
     """Create a DocumentConverter configured for the specified processing tier.
 
     Args:
         processing_tier: One of 'lightweight', 'standard', 'advanced'
+        languages: OCR language codes (defaults to ['en'])
+        force_full_page_ocr: Force OCR on all pages
 
     Returns:
         Configured DocumentConverter instance
@@ -88,13 +101,14 @@ def create_converter(processing_tier: str = "standard") -> Any:
     # IMPORTANT: Set EasyOcrOptions LAST to avoid overwriting other OCR settings
     # See research.md for details on this configuration order sensitivity
     ocr_options = EasyOcrOptions()
-    ocr_options.lang = ["en"]  # Default to English, can be extended
+    ocr_options.lang = list(languages) if languages else ["en"]
+    ocr_options.force_full_page_ocr = force_full_page_ocr
     pipeline_options.ocr_options = ocr_options
 
     logger.info(
         "ocr_engine_configured",
         engine="easyocr",
-        languages=["en"],
+        languages=ocr_options.lang,
     )
 
     return DocumentConverter(
@@ -104,6 +118,79 @@ def create_converter(processing_tier: str = "standard") -> Any:
     )
 
 
+async def get_converter(
+    processing_tier: str = "standard",
+    languages: list[str] | None = None,
+    force_full_page_ocr: bool = False,
+) -> Any:
+    """Get a cached DocumentConverter for the given configuration.
+
+    The first call per configuration builds the converter (loading OCR models);
+    later calls return the cached instance.
+
+    Args:
+        processing_tier: One of 'lightweight', 'standard', 'advanced'
+        languages: OCR language codes (defaults to ['en'])
+        force_full_page_ocr: Force OCR on all pages
+
+    Returns:
+        Configured DocumentConverter instance
+    """
+    key = (processing_tier, tuple(languages) if languages else ("en",), force_full_page_ocr)
+
+    converter = _CONVERTERS.get(key)
+    if converter is not None:
+        return converter
+
+    async with _CONV_LOCK:
+        # Re-check after acquiring the lock; another task may have built it
+        converter = _CONVERTERS.get(key)
+        if converter is None:
+            converter = create_converter(processing_tier, languages, force_full_page_ocr)
+            _CONVERTERS[key] = converter
+        return converter
+
+
+# Retry policy for transient conversion failures (GPU OOM, model-load
+# races, resource timeouts); terminal errors are re-raised immediately
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_SECONDS = 1.0
+_RETRY_CAP_SECONDS = 30.0
+_RETRYABLE_MARKERS = ("rate limit", "quota", "timeout", "out of memory", "oom")
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Classify an exception as transient (worth retrying) or terminal."""
+    if isinstance(exc, FileNotFoundError | PermissionError):
+        return False
+    message = str(exc).lower()
+    return any(marker in message for marker in _RETRYABLE_MARKERS)
+
+
+async def _convert_with_retry(converter: Any, file_path: str, log: Any) -> Any:
+    """Run converter.convert off the loop, retrying transient failures.
+
+    Exponential backoff with jitter: base * 2**attempt capped at
+    _RETRY_CAP_SECONDS, up to _RETRY_ATTEMPTS attempts total.
+    """
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            return await asyncio.to_thread(converter.convert, file_path)
+        except Exception as e:
+            if attempt == _RETRY_ATTEMPTS - 1 or not _is_retryable(e):
+                raise
+            delay = min(_RETRY_CAP_SECONDS, _RETRY_BASE_SECONDS * 2**attempt)
+            delay += random.uniform(0, _RETRY_BASE_SECONDS / 2)
+            log.warning(
+                "conversion_retrying",
+                attempt=attempt + 1,
+                max_attempts=_RETRY_ATTEMPTS,
+                delay_seconds=round(delay, 2),
+                error=str(e),
+            )
+            await asyncio.sleep(delay)
+
+
 async def process_document(
     file_path: str,
     processing_tier: str | None = None,
@@ -141,19 +228,22 @@ async def process_document(
     log.info("processing_started")
 
     try:
-        # Create converter with specified tier
-        converter = create_converter(tier)
+        # Deferred import, resolved from sys.modules after the first call
+        from docling.datamodel.base_models import ConversionStatus
+
+        # Get cached converter for this tier/language configuration
+        converter = await get_converter(tier, languages, force_full_page_ocr)
 
-        # Configure OCR languages if specified
         if languages:
-            # Note: Would need to recreate converter with different language settings
             log.info("ocr_languages_override", languages=languages)
 
-        # Convert document
+        # Convert document off the event loop; converter.convert is synchronous
+        # and CPU-bound, and would otherwise stall every other request
+        # (including /health) for the duration of the conversion.
         log.info("conversion_starting")
-        result = converter.convert(file_path)
+        result = await _convert_with_retry(converter, file_path, log)
 
-        if result.status.name != "SUCCESS":
+        if result.status is not ConversionStatus.SUCCESS:
             log.error(
                 "conversion_failed",
                 status=result.status.name,
@@ -167,13 +257,14 @@ async def process_document(
 
         log.info("conversion_completed", status="SUCCESS")
 
-        # Generate Markdown (with or without page markers)
+        # Generate Markdown (with or without page markers) off the event loop;
+        # rendering a large document is pure CPU work.
         log.info("markdown_generation_starting", include_page_markers=include_page_markers)
         if include_page_markers:
-            markdown = generate_page_annotated_markdown(result.document)
+            markdown = await asyncio.to_thread(generate_page_annotated_markdown, result.document)
         else:
             # Use docling's built-in export for clean markdown without page markers
-            markdown = result.document.export_to_markdown()
+            markdown = await asyncio.to_thread(result.document.export_to_markdown)
         log.info("markdown_generation_completed", length=len(markdown))
 
         # Extract metadata
@@ -226,3 +317,52 @@ async def process_document(
             "markdown": None,
             "metadata": None,
         }
+
+
+async def process_documents(
+    file_paths: list[str],
+    processing_tier: str | None = None,
+    languages: list[str] | None = None,
+    force_full_page_ocr: bool = False,
+    include_page_markers: bool = False,
+    trace_id: str | None = None,
+    max_concurrency: int = 8,
+    queue_priority: str = "standard",
+) -> list:
+    """Process multiple documents concurrently with a concurrency bound.
+
+    Fans the files out via asyncio.gather behind a semaphore so at most
+    max_concurrency conversions are in flight; OCR-bound documents overlap
+    instead of running strictly one after another.
+
+    Args:
+        file_paths: Paths to the document files
+        processing_tier: Override default processing tier
+        languages: OCR language codes
+        force_full_page_ocr: Force OCR on all pages
+        include_page_markers: Include page number markers in output
+        trace_id: Trace ID for log correlation
+        max_concurrency: Maximum conversions in flight at once
+        queue_priority: 'batch' caps concurrency at 2 so latency-tolerant
+            backfills leave headroom for interactive jobs
+
+    Returns:
+        Result dicts in file_paths order; unexpected exceptions appear
+        in place of their result
+    """
+    if queue_priority == "batch":
+        max_concurrency = min(max_concurrency, 2)
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _one(path: str) -> dict:
+        async with sem:
+            return await process_document(
+                file_path=path,
+                processing_tier=processing_tier,
+                languages=languages,
+                force_full_page_ocr=force_full_page_ocr,
+                include_page_markers=include_page_markers,
+                trace_id=trace_id,
+            )
+
+    return await asyncio.gather(*(_one(path) for path in file_paths), return_exceptions=True)
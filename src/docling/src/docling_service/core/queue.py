@@ -1,40 +1,105 @@
 """Job queue for managing document processing with configurable concurrency."""
 
 import asyncio
-import uuid
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from enum import Enum
-from typing import Any
+from typing import Any, Final, Literal
 
 import psutil
 import structlog
 
 from docling_service.core.config import calculate_timeout, settings
 from docling_service.core.converter import process_document
+from docling_service.core.ids import new_trace_id
+from docling_service.core.logging import bind_trace_context, clear_trace_context
 from docling_service.core.tempfiles import cleanup_job_temp_files
 
 logger = structlog.get_logger(__name__)
 
+# Shared handle for RSS sampling; constructing psutil.Process() re-reads
+# /proc/self on every call, so build it once per process.
+_PROCESS = psutil.Process()
 
-class JobState(str, Enum):
-    """Job processing states."""
+# Monotonic timestamp of the last RSS sample, shared across workers
+_last_rss_sample = 0.0
 
-    QUEUED = "queued"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
 
+def _maybe_sample_rss() -> float | None:
+    """Sample the process RSS in MB, or None when disabled/rate-limited.
 
-@dataclass
+    Each memory_info() call parses /proc on Linux, which adds up under
+    concurrent workers with fast jobs, so sampling is opt-in and throttled
+    to one read per memory_logging_interval_s across all workers.
+    """
+    global _last_rss_sample
+
+    if not settings.memory_logging_enabled:
+        return None
+
+    now = time.monotonic()
+    if now - _last_rss_sample < settings.memory_logging_interval_s:
+        return None
+
+    _last_rss_sample = now
+    return _PROCESS.memory_info().rss / (1024 * 1024)
+
+
+# Job state values as Literal for type hints on Job.state
+JobStateValue = Literal["queued", "processing", "completed", "failed", "cancelled"]
+
+
+class JobState:
+    """Job processing states.
+
+    Plain string constants rather than an Enum: state comparisons run in
+    the worker hot path and eviction scans every job, so equality should
+    be a pointer compare, not Enum machinery. CPython interns these
+    identifier-like literals itself, so comparisons against other literals
+    short-circuit on identity without an explicit sys.intern.
+    """
+
+    QUEUED: Final[JobStateValue] = "queued"
+    PROCESSING: Final[JobStateValue] = "processing"
+    COMPLETED: Final[JobStateValue] = "completed"
+    FAILED: Final[JobStateValue] = "failed"
+    CANCELLED: Final[JobStateValue] = "cancelled"
+
+
+# States a job can never leave; only these are eligible for history eviction
+_TERMINAL_STATES = frozenset({JobState.COMPLETED, JobState.FAILED, JobState.CANCELLED})
+
+# Fields that feed to_dict(); assigning any of them drops the cached payload
+_DICT_FIELDS = frozenset(
+    {
+        "state",
+        "progress",
+        "result",
+        "error",
+        "error_type",
+        "started_at_iso",
+        "completed_at_iso",
+    }
+)
+
+
+@dataclass(slots=True)
 class Job:
-    """Represents a document processing job."""
+    """Represents a document processing job.
+
+    Slotted to drop the per-instance __dict__; job history is long-lived, so
+    the per-job footprint matters. ISO timestamp strings are cached next to
+    their datetime fields so every status poll doesn't re-run isoformat(),
+    and the full to_dict() payload is memoized until a field it contains is
+    reassigned — status polling re-serializes mostly unchanged jobs.
+    """
 
     id: str
     file_path: str
     options: dict
-    state: JobState = JobState.QUEUED
+    state: JobStateValue = JobState.QUEUED
     progress: int = 0
     result: dict | None = None
     error: str | None = None
@@ -46,22 +111,82 @@ class Job:
     correlation_id: str | None = None
     memory_start_mb: float | None = None
     memory_end_mb: float | None = None
+    created_at_iso: str = field(init=False, default="")
+    started_at_iso: str | None = field(init=False, default=None)
+    completed_at_iso: str | None = field(init=False, default=None)
+    _dict_cache: dict | None = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        self.created_at_iso = self.created_at.isoformat()
+
+    def __setattr__(
+        self,
+        name: str,
+        value: Any,
+        _dict_fields: frozenset = _DICT_FIELDS,
+        _set: Any = object.__setattr__,
+    ) -> None:
+        # One frozenset probe per write buys cache invalidation without
+        # wrapping every mutable field in a property
+        if name in _dict_fields:
+            _set(self, "_dict_cache", None)
+        _set(self, name, value)
+
+    def mark_started(self, now: datetime) -> None:
+        """Record the processing start time."""
+        self.started_at = now
+        self.started_at_iso = now.isoformat()
+
+    def mark_completed(self, now: datetime) -> None:
+        """Record the processing completion time."""
+        self.completed_at = now
+        self.completed_at_iso = now.isoformat()
 
     def to_dict(self) -> dict:
-        """Convert job to dictionary for API response."""
-        return {
+        """Convert job to dictionary for API response.
+
+        The dict is cached until a contained field changes; callers must
+        treat it as read-only.
+        """
+        cached = self._dict_cache
+        if cached is not None:
+            return cached
+        payload = {
             "job_id": self.id,
             "file_path": self.file_path,
-            "status": self.state.value,
+            "status": self.state,
             "progress": self.progress,
             "result": self.result,
             "error": self.error,
             "error_type": self.error_type,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self.created_at_iso,
+            "started_at": self.started_at_iso,
+            "completed_at": self.completed_at_iso,
             "trace_id": self.trace_id,
         }
+        self._dict_cache = payload
+        return payload
+
+
+# Batch-priority jobs (nightly backfills and the like) tolerate latency, so
+# they get a generous timeout instead of failing on a busy machine
+_BATCH_TIMEOUT_MULTIPLIER = 4
+
+
+def _job_timeout(job: Job) -> int:
+    """Resolve the effective processing timeout for a job.
+
+    An explicit timeout_seconds option wins; otherwise the timeout is
+    calculated from the tier, then scaled up for batch-priority jobs.
+    """
+    # TODO: Estimate page count before processing for accurate timeout
+    timeout_seconds = job.options.get("timeout_seconds") or calculate_timeout(
+        page_count=100,  # Assume max for timeout
+        tier=job.options.get("processing_tier"),
+    )
+    if job.options.get("queue_priority") == "batch":
+        timeout_seconds *= _BATCH_TIMEOUT_MULTIPLIER
+    return timeout_seconds
 
 
 class JobQueue:
@@ -69,41 +194,78 @@ class JobQueue:
 
     def __init__(self) -> None:
         """Initialize the job queue."""
-        self._jobs: dict[str, Job] = {}
-        self._queue: asyncio.Queue[str] = asyncio.Queue()
-        self._workers: list[asyncio.Task[None]] = []
+        # Insertion-ordered so eviction can drop the oldest finished jobs
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        # Secondary index so batch lookups are one dict get instead of a
+        # scan over the whole job table
+        self._jobs_by_correlation: defaultdict[str, set[str]] = defaultdict(set)
+        # Ids currently in _process_job; makes active_count() O(1) instead
+        # of a state scan over the whole history on every /health poll
+        self._processing: set[str] = set()
+        # None is the shutdown sentinel pushed by stop()
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue()
+        # Strong refs: create_task results are weakly held by the loop and
+        # can be garbage-collected mid-flight without them
+        self._workers: set[asyncio.Task[None]] = set()
         self._running = False
+        # Lazy structlog proxy until start() resolves a concrete logger
+        self._log: Any = logger
 
     async def start(self) -> None:
         """Start the job queue workers."""
         self._running = True
         num_workers = settings.max_concurrent_jobs
 
-        logger.info(
+        # Resolve the lazy proxy once so per-event logging skips proxy
+        # re-resolution; done here (not __init__) so logging is configured
+        self._log = logger.bind()
+
+        self._log.info(
             "queue_starting",
             num_workers=num_workers,
         )
 
         for i in range(num_workers):
             worker = asyncio.create_task(self._worker(i))
-            self._workers.append(worker)
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
 
-        logger.info("queue_started", num_workers=len(self._workers))
+        self._log.info("queue_started", num_workers=len(self._workers))
 
     async def stop(self) -> None:
-        """Stop all workers and clear the queue."""
-        logger.info("queue_stopping")
-        self._running = False
+        """Stop all workers and clear the queue.
 
-        for worker in self._workers:
-            worker.cancel()
+        Each worker receives a None sentinel through the queue so it exits
+        after finishing its current job; cancellation remains as a fallback
+        for workers stuck inside a job.
+        """
+        self._log.info("queue_stopping")
+        self._running = False
 
-        # Wait for workers to finish
-        if self._workers:
-            await asyncio.gather(*self._workers, return_exceptions=True)
+        # Snapshot first: done callbacks discard finished tasks from the set
+        workers = list(self._workers)
+        for _ in workers:
+            await self._queue.put(None)
+
+        # Wait for workers to finish; no return_exceptions so a worker that
+        # died with a real error surfaces at shutdown instead of vanishing
+        if workers:
+            await asyncio.gather(*workers)
+
+        # A worker that was mid-job when stop() ran exits via the _running
+        # check without consuming its sentinel. Drain the leftovers so
+        # size() stays accurate and a later start() doesn't feed stale
+        # sentinels to fresh workers; pending job ids are kept.
+        pending: list[str] = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                pending.append(item)
+        for job_id in pending:
+            self._queue.put_nowait(job_id)
 
         self._workers.clear()
-        logger.info("queue_stopped")
+        self._log.info("queue_stopped")
 
     async def enqueue(
         self,
@@ -123,18 +285,51 @@ class JobQueue:
         Returns:
             Job ID
         """
-        job_id = str(uuid.uuid4())
+        job = await self.enqueue_and_return(
+            file_path,
+            options=options,
+            trace_id=trace_id,
+            correlation_id=correlation_id,
+        )
+        return job.id
+
+    async def enqueue_and_return(
+        self,
+        file_path: str,
+        options: dict | None = None,
+        trace_id: str | None = None,
+        correlation_id: str | None = None,
+    ) -> Job:
+        """Enqueue a document and return the live Job object.
+
+        Saves callers that immediately need the Job (workers, tests,
+        logging) the follow-up id lookup that enqueue() forces on them.
+
+        Args:
+            file_path: Path to the document
+            options: Processing options
+            trace_id: Trace ID for log correlation
+            correlation_id: Correlation ID for batch jobs
+
+        Returns:
+            The enqueued Job
+        """
+        job_id = new_trace_id()
         job = Job(
             id=job_id,
             file_path=file_path,
             options=options or {},
-            trace_id=trace_id or str(uuid.uuid4()),
+            trace_id=trace_id or new_trace_id(),
             correlation_id=correlation_id,
         )
         self._jobs[job_id] = job
+        if correlation_id:
+            self._jobs_by_correlation[correlation_id].add(job_id)
+        if len(self._jobs) > settings.max_job_history:
+            self._evict_finished_jobs()
         await self._queue.put(job_id)
 
-        logger.info(
+        self._log.info(
             "job_enqueued",
             job_id=job_id,
             file_path=file_path,
@@ -143,7 +338,125 @@ class JobQueue:
             queue_size=self._queue.qsize(),
         )
 
-        return job_id
+        return job
+
+    async def enqueue_many(
+        self,
+        file_paths: list[str],
+        options: dict | None = None,
+        trace_id: str | None = None,
+        correlation_id: str | None = None,
+    ) -> list[str]:
+        """Add a batch of documents to the processing queue in one pass.
+
+        Jobs are built and bulk-inserted together and handed to the queue
+        with put_nowait, so a batch costs one pass with no await per file;
+        a single summary log event replaces per-job enqueue logs.
+
+        Args:
+            file_paths: Paths to the documents
+            options: Processing options shared by the batch
+            trace_id: Trace ID for log correlation
+            correlation_id: Correlation ID linking the batch
+
+        Returns:
+            Job IDs in file_paths order
+        """
+        options = options or {}
+        # One wall-clock read for the whole batch: the jobs arrive together,
+        # so a shared created_at is accurate and saves a tz-aware datetime
+        # construction per file
+        now = datetime.now(timezone.utc)
+        jobs = [
+            Job(
+                id=new_trace_id(),
+                file_path=file_path,
+                options=options,
+                created_at=now,
+                trace_id=trace_id or new_trace_id(),
+                correlation_id=correlation_id,
+            )
+            for file_path in file_paths
+        ]
+        job_ids = [job.id for job in jobs]
+
+        self._jobs.update((job.id, job) for job in jobs)
+        if correlation_id:
+            self._jobs_by_correlation[correlation_id].update(job_ids)
+        if len(self._jobs) > settings.max_job_history:
+            self._evict_finished_jobs()
+        for job_id in job_ids:
+            self._queue.put_nowait(job_id)
+
+        self._log.info(
+            "batch_enqueued",
+            job_count=len(job_ids),
+            trace_id=trace_id,
+            correlation_id=correlation_id,
+            queue_size=self._queue.qsize(),
+        )
+
+        return job_ids
+
+    def _evict_finished_jobs(self) -> None:
+        """Drop the oldest finished jobs until the history cap is respected.
+
+        Queued/processing jobs are never evicted, so the history can
+        temporarily exceed the cap while that many jobs are still live.
+        """
+        excess = len(self._jobs) - settings.max_job_history
+        if excess <= 0:
+            return
+
+        # Scan from the front (oldest first) and stop as soon as enough
+        # terminal jobs are found: at steady state the oldest entries are
+        # finished, so each enqueue evicts after inspecting a handful of
+        # jobs instead of walking the whole history
+        evictable = []
+        for job_id, job in self._jobs.items():
+            if job.state in _TERMINAL_STATES:
+                evictable.append(job_id)
+                if len(evictable) == excess:
+                    break
+        for job_id in evictable:
+            self._drop_from_correlation_index(self._jobs[job_id])
+            del self._jobs[job_id]
+
+        if evictable:
+            self._log.debug(
+                "job_history_evicted",
+                evicted=len(evictable),
+                history_size=len(self._jobs),
+            )
+
+    def reset(self) -> None:
+        """Clear all job bookkeeping without tearing down asyncio primitives.
+
+        The worker set and underlying asyncio.Queue survive, so a running
+        queue keeps its workers; only jobs, the correlation index and any
+        pending queue entries are dropped. Used by tests that share one
+        queue instance and by restart paths.
+        """
+        # Rebind rather than clear(): dropping the old containers frees them
+        # in one refcount decrement instead of walking every slot, which
+        # matters when a large history is being discarded. The asyncio.Queue
+        # must NOT be rebound — workers block on the original instance — so
+        # pending entries are drained in place.
+        self._jobs = OrderedDict()
+        self._jobs_by_correlation = defaultdict(set)
+        self._processing = set()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def _drop_from_correlation_index(self, job: Job) -> None:
+        """Remove a job from the correlation index, pruning empty batches."""
+        if not job.correlation_id:
+            return
+        members = self._jobs_by_correlation.get(job.correlation_id)
+        if members is not None:
+            members.discard(job.id)
+            if not members:
+                del self._jobs_by_correlation[job.correlation_id]
 
     async def cancel(self, job_id: str) -> bool:
         """Cancel a queued job.
@@ -156,23 +469,23 @@ class JobQueue:
         """
         job = self._jobs.get(job_id)
         if not job:
-            logger.warning("cancel_failed_not_found", job_id=job_id)
+            self._log.warning("cancel_failed_not_found", job_id=job_id)
             return False
 
         if job.state == JobState.QUEUED:
             job.state = JobState.CANCELLED
-            job.completed_at = datetime.now(timezone.utc)
-            logger.info(
+            job.mark_completed(datetime.now(timezone.utc))
+            self._log.info(
                 "job_cancelled",
                 job_id=job_id,
                 trace_id=job.trace_id,
             )
             return True
 
-        logger.warning(
+        self._log.warning(
             "cancel_failed_not_queued",
             job_id=job_id,
-            current_state=job.state.value,
+            current_state=job.state,
         )
         return False
 
@@ -188,13 +501,65 @@ class JobQueue:
         job = self._jobs.get(job_id)
         return job.to_dict() if job else None
 
+    def get_job_obj(self, job_id: str) -> Job | None:
+        """Get the live Job object by ID, without dict conversion.
+
+        For callers (workers, tests) that want to read or mutate the job
+        itself; API handlers should keep using get_job for the serialized
+        form.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The Job, or None if not found
+        """
+        return self._jobs.get(job_id)
+
+    def get_by_correlation_id(self, correlation_id: str) -> list[dict]:
+        """Get all jobs in a batch via the correlation index.
+
+        One dict lookup plus O(batch size) materialization, instead of
+        scanning every job in the history.
+
+        Args:
+            correlation_id: Batch correlation identifier
+
+        Returns:
+            Job dictionaries for the batch (empty list if unknown)
+        """
+        job_ids = self._jobs_by_correlation.get(correlation_id)
+        if not job_ids:
+            return []
+        jobs = self._jobs
+        return [jobs[job_id].to_dict() for job_id in job_ids]
+
+    def iter_jobs(self) -> Iterator[dict]:
+        """Iterate over job dictionaries lazily, in insertion order.
+
+        Lets callers filter or stream large histories without materializing
+        every job dict up front.
+
+        Yields:
+            Job dictionaries
+        """
+        return (job.to_dict() for job in self._jobs.values())
+
     def list_jobs(self) -> list[dict]:
         """List all jobs.
 
         Returns:
             List of job dictionaries
         """
-        return [job.to_dict() for job in self._jobs.values()]
+        return list(self.iter_jobs())
+
+    def list_job_ids(self) -> list[str]:
+        """List all job IDs without materializing job dictionaries.
+
+        Returns:
+            Job IDs in insertion order
+        """
+        return list(self._jobs)
 
     def size(self) -> int:
         """Get number of jobs waiting in queue.
@@ -207,27 +572,33 @@ class JobQueue:
     def active_count(self) -> int:
         """Get number of active (processing) jobs.
 
+        O(1): _process_job maintains the processing set, which is the only
+        path through which jobs enter or leave the PROCESSING state.
+
         Returns:
             Number of processing jobs
         """
-        return sum(1 for job in self._jobs.values() if job.state == JobState.PROCESSING)
+        return len(self._processing)
 
     async def _worker(self, worker_id: int) -> None:
         """Worker coroutine for processing jobs.
 
+        Blocks on the queue until a job (or the None shutdown sentinel from
+        stop()) arrives, so idle workers cost no wakeups.
+
         Args:
             worker_id: Worker identifier for logging
         """
-        log = logger.bind(worker_id=worker_id)
-        log.info("worker_started")
+        log = self._log.bind(worker_id=worker_id)
+        # Heartbeat-style events stay at debug: with the filtering bound
+        # logger they short-circuit to a no-op at the default INFO level
+        log.debug("worker_started")
 
         while self._running:
             try:
-                # Wait for a job with timeout
-                try:
-                    job_id = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    continue
+                job_id = await self._queue.get()
+                if job_id is None:
+                    break
 
                 job = self._jobs.get(job_id)
                 if not job or job.state == JobState.CANCELLED:
@@ -236,12 +607,12 @@ class JobQueue:
                 await self._process_job(job, log)
 
             except asyncio.CancelledError:
-                log.info("worker_cancelled")
+                log.debug("worker_cancelled")
                 break
             except Exception as e:
                 log.exception("worker_error", error=str(e))
 
-        log.info("worker_stopped")
+        log.debug("worker_stopped")
 
     async def _process_job(self, job: Job, log: Any) -> None:
         """Process a single job.
@@ -250,33 +621,27 @@ class JobQueue:
             job: Job to process
             log: Bound logger
         """
-        job_log = log.bind(
-            job_id=job.id,
-            trace_id=job.trace_id,
-            file_path=job.file_path,
-        )
+        # Bind job context once via contextvars instead of copying the bound
+        # logger's dict on every log call; merge_contextvars picks these up
+        bind_trace_context(job.trace_id or "", job.correlation_id)
+        structlog.contextvars.bind_contextvars(job_id=job.id, file_path=job.file_path)
 
         # Update state to processing
         job.state = JobState.PROCESSING
-        job.started_at = datetime.now(timezone.utc)
+        self._processing.add(job.id)
+        job.mark_started(datetime.now(timezone.utc))
         job.progress = 10
 
-        # Log memory at start
-        process = psutil.Process()
-        job.memory_start_mb = process.memory_info().rss / (1024 * 1024)
+        # Sample memory at start (opt-in, rate-limited)
+        job.memory_start_mb = _maybe_sample_rss()
 
-        job_log.info(
-            "job_processing_started",
-            memory_mb=job.memory_start_mb,
-        )
+        if job.memory_start_mb is not None:
+            log.info("job_processing_started", memory_mb=job.memory_start_mb)
+        else:
+            log.info("job_processing_started")
 
         try:
-            # Calculate timeout
-            # TODO: Estimate page count before processing for accurate timeout
-            timeout_seconds = job.options.get("timeout_seconds") or calculate_timeout(
-                page_count=100,  # Assume max for timeout
-                tier=job.options.get("processing_tier"),
-            )
+            timeout_seconds = _job_timeout(job)
 
             job.progress = 20
 
@@ -298,7 +663,7 @@ class JobQueue:
             if result["status"] == "success":
                 job.state = JobState.COMPLETED
                 job.result = result
-                job_log.info(
+                log.info(
                     "job_completed",
                     page_count=result.get("metadata", {}).get("page_count"),
                     processing_time_ms=result.get("metadata", {}).get("processing_time_ms"),
@@ -307,7 +672,7 @@ class JobQueue:
                 job.state = JobState.FAILED
                 job.error = result.get("error", "Unknown error")
                 job.error_type = "processing_error"
-                job_log.error(
+                log.error(
                     "job_failed",
                     error=job.error,
                     error_type=job.error_type,
@@ -317,7 +682,7 @@ class JobQueue:
             job.state = JobState.FAILED
             job.error = f"Processing timeout after {timeout_seconds} seconds"
             job.error_type = "timeout"
-            job_log.error(
+            log.error(
                 "job_timeout",
                 timeout_seconds=timeout_seconds,
                 error_type=job.error_type,
@@ -327,29 +692,34 @@ class JobQueue:
             job.state = JobState.FAILED
             job.error = str(e)
             job.error_type = "processing_error"
-            job_log.exception(
+            log.exception(
                 "job_exception",
                 error=str(e),
                 error_type=job.error_type,
             )
 
         finally:
-            job.completed_at = datetime.now(timezone.utc)
+            self._processing.discard(job.id)
+            job.mark_completed(datetime.now(timezone.utc))
             job.progress = 100
 
-            # Log memory at end
-            job.memory_end_mb = process.memory_info().rss / (1024 * 1024)
-            job_log.info(
-                "job_finished",
-                state=job.state.value,
-                memory_start_mb=job.memory_start_mb,
-                memory_end_mb=job.memory_end_mb,
-                memory_delta_mb=job.memory_end_mb - (job.memory_start_mb or 0),
-            )
+            # Sample memory at end; only emit memory fields when sampled
+            job.memory_end_mb = _maybe_sample_rss()
+            finish_fields: dict[str, Any] = {"state": job.state}
+            if job.memory_end_mb is not None:
+                finish_fields["memory_end_mb"] = job.memory_end_mb
+                if job.memory_start_mb is not None:
+                    finish_fields["memory_start_mb"] = job.memory_start_mb
+                    finish_fields["memory_delta_mb"] = job.memory_end_mb - job.memory_start_mb
+            log.info("job_finished", **finish_fields)
 
             # Clean up temp files (T084)
             cleanup_job_temp_files(job.id, job.trace_id)
 
+            # Drop the job context so the next job on this worker starts clean
+            clear_trace_context()
+            structlog.contextvars.unbind_contextvars("job_id", "file_path")
+
 
 # Global job queue instance
 job_queue = JobQueue()
@@ -5,6 +5,8 @@ Provides utilities for:
 - Cleaning up orphaned temp files on service startup (T085)
 """
 
+import asyncio
+import contextlib
 import os
 import shutil
 import tempfile
@@ -27,10 +29,7 @@ def get_temp_dir() -> Path:
     Returns:
         Path to the temp directory (uses system temp if not configured)
     """
-    if settings.temp_dir:
-        path = Path(settings.temp_dir)
-    else:
-        path = Path(tempfile.gettempdir()) / "docling"
+    path = Path(settings.temp_dir) if settings.temp_dir else Path(tempfile.gettempdir()) / "docling"
 
     # Ensure directory exists
     path.mkdir(parents=True, exist_ok=True)
@@ -103,34 +102,37 @@ def cleanup_orphaned_temp_files(max_age_seconds: int = ORPHAN_AGE_SECONDS) -> in
         return 0
 
     try:
-        for item in temp_dir.iterdir():
-            if not item.is_dir():
-                continue
-
-            # Check if it's a job directory (starts with "job_")
-            if not item.name.startswith("job_"):
-                continue
-
-            # Check age
-            try:
-                mtime = item.stat().st_mtime
-                age = current_time - mtime
-
-                if age > max_age_seconds:
-                    logger.info(
-                        "orphan_temp_dir_found",
-                        path=str(item),
-                        age_seconds=int(age),
+        # scandir batches directory reads and caches stat results on the
+        # DirEntry, so dirty temp dirs with thousands of entries scan fast
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                # Check if it's a job directory (starts with "job_")
+                if not entry.name.startswith("job_"):
+                    continue
+
+                # Check age
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                    age = current_time - mtime
+
+                    if age > max_age_seconds:
+                        logger.info(
+                            "orphan_temp_dir_found",
+                            path=entry.path,
+                            age_seconds=int(age),
+                        )
+                        shutil.rmtree(entry.path)
+                        cleaned_count += 1
+                        logger.info("orphan_temp_dir_cleaned", path=entry.path)
+                except Exception as e:
+                    logger.error(
+                        "orphan_cleanup_item_failed",
+                        path=entry.path,
+                        error=str(e),
                     )
-                    shutil.rmtree(item)
-                    cleaned_count += 1
-                    logger.info("orphan_temp_dir_cleaned", path=str(item))
-            except Exception as e:
-                logger.error(
-                    "orphan_cleanup_item_failed",
-                    path=str(item),
-                    error=str(e),
-                )
 
     except Exception as e:
         logger.error(
@@ -147,6 +149,62 @@ def cleanup_orphaned_temp_files(max_age_seconds: int = ORPHAN_AGE_SECONDS) -> in
     return cleaned_count
 
 
+async def cleanup_orphaned_temp_files_async(max_age_seconds: int = ORPHAN_AGE_SECONDS) -> int:
+    """Async wrapper for orphan cleanup (T085).
+
+    The scan and rmtree calls are blocking filesystem work; run them in a
+    thread so startup from an async lifespan doesn't stall the event loop.
+
+    Args:
+        max_age_seconds: Maximum age in seconds before a file is considered orphaned
+
+    Returns:
+        Number of directories cleaned up
+    """
+    return await asyncio.to_thread(cleanup_orphaned_temp_files, max_age_seconds)
+
+
+def _scan_size(root: str) -> int:
+    """Recursively sum file sizes under root using os.scandir.
+
+    DirEntry.stat() reuses the data fetched during the directory read, so
+    this avoids the extra stat per file that os.walk + getsize would do.
+    """
+    total_size = 0
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    total_size += _scan_size(entry.path)
+            except OSError:
+                pass
+    return total_size
+
+
+def _walk_stats(root: str) -> tuple[int, int]:
+    """Compute (size_bytes, job_count) in a single traversal.
+
+    Walks the top level once, counting job_* directories while summing
+    sizes, so stats callers don't pay for two full passes over the tree.
+    """
+    total_size = 0
+    job_count = 0
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    if entry.name.startswith("job_"):
+                        job_count += 1
+                    total_size += _scan_size(entry.path)
+            except OSError:
+                pass
+    return total_size, job_count
+
+
 def get_temp_dir_size() -> int:
     """Get the total size of the temp directory in bytes.
 
@@ -154,23 +212,14 @@ def get_temp_dir_size() -> int:
         Total size in bytes
     """
     temp_dir = get_temp_dir()
-    total_size = 0
 
     if not temp_dir.exists():
         return 0
 
     try:
-        for dirpath, _dirnames, filenames in os.walk(temp_dir):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                try:
-                    total_size += os.path.getsize(filepath)
-                except (OSError, FileNotFoundError):
-                    pass
+        return _scan_size(str(temp_dir))
     except Exception:
-        pass
-
-    return total_size
+        return 0
 
 
 def get_temp_dir_stats() -> dict:
@@ -190,12 +239,7 @@ def get_temp_dir_stats() -> dict:
     if not temp_dir.exists():
         return stats
 
-    try:
-        stats["size_bytes"] = get_temp_dir_size()
-        stats["job_count"] = sum(
-            1 for item in temp_dir.iterdir() if item.is_dir() and item.name.startswith("job_")
-        )
-    except Exception:
-        pass
+    with contextlib.suppress(Exception):
+        stats["size_bytes"], stats["job_count"] = _walk_stats(str(temp_dir))
 
     return stats
@@ -4,103 +4,153 @@ This module implements custom post-processing to preserve page provenance
 since default export_to_markdown() strips this information.
 """
 
+import sys
+from collections.abc import Callable, Iterator
+from operator import itemgetter
 from typing import Any
 
+# Extracts the element from iterate_items' (item, level) tuples in C
+_get_item = itemgetter(0)
 
-def generate_page_annotated_markdown(document: Any) -> str:
-    """Generate Markdown with embedded page number annotations.
+# Comment and span marker emitted together: one format call and one yield
+# per page transition instead of two separate string builds
+_PAGE_MARKER = '\n<!-- PAGE: {n} -->\n<span data-page="{n}"></span>\n'
 
-    This implements custom post-processing to preserve page provenance
-    since default export_to_markdown() strips this information.
+
+def iter_page_annotated_markdown(document: Any) -> Iterator[str]:
+    """Yield page-annotated Markdown fragments one element at a time.
+
+    Streaming companion to generate_page_annotated_markdown: callers that
+    can consume chunks (e.g. a streaming HTTP response) avoid holding the
+    whole rendered document in memory.
 
     Args:
         document: DoclingDocument object from conversion
 
-    Returns:
-        Markdown string with page markers embedded
+    Yields:
+        Markdown fragments, each ending in a newline
     """
-    markdown_parts: list[str] = []
-    current_page: int | None = None
+    # Locals resolve via LOAD_FAST; worth it for names touched per element
+    _getattr = getattr
+    _to_markdown = _element_to_markdown
+
+    # Single-page fast path: the whole document sits on one page, so emit
+    # the marker once up front and skip the per-element provenance walk
+    pages = _getattr(document, "pages", None)
+    if isinstance(pages, dict) and len(pages) == 1:
+        page_no = next(iter(pages))
+        yield _PAGE_MARKER.format(n=page_no)
+        for element in map(_get_item, document.iterate_items()):
+            element_md = _to_markdown(element)
+            if element_md:
+                yield element_md
+        return
 
-    # Iterate through document elements with provenance
-    for element, _level in document.iterate_items():
-        # Extract page number from provenance
-        page_no = _extract_page_number(element)
+    current_page: int | None = None
 
-        # Add page marker if page changed
-        if page_no is not None and page_no != current_page:
+    # Iterate through document elements with provenance; the level half of
+    # each (item, level) tuple is unused, so map+itemgetter pulls the
+    # element out in C instead of unpacking per iteration
+    for element in map(_get_item, document.iterate_items()):
+        # Extract page number from provenance, inlined: this runs once per
+        # element and the common case (prov[0] carries page_no) should cost
+        # two attribute loads, not a helper call plus hasattr walks
+        prov = _getattr(element, "prov", None)
+        if prov:
+            # try/except beats hasattr here: docling provenance virtually
+            # always carries page_no, making the success path near-free
+            try:
+                page_no = prov[0].page_no
+            except AttributeError:
+                page_no = next((p.page_no for p in prov if hasattr(p, "page_no")), None)
+        else:
+            page_no = None
+
+        # Add page marker if page changed; != first so the common same-page
+        # case short-circuits after a single compare
+        if page_no != current_page and page_no is not None:
             current_page = page_no
-            markdown_parts.append(f"\n<!-- PAGE: {page_no} -->\n")
-            markdown_parts.append(f'<span data-page="{page_no}"></span>\n')
+            yield _PAGE_MARKER.format(n=page_no)
 
         # Convert element to Markdown
-        element_md = _element_to_markdown(element)
+        element_md = _to_markdown(element)
         if element_md:
-            markdown_parts.append(element_md)
+            yield element_md
 
-    return "\n".join(markdown_parts)
 
+def generate_page_annotated_markdown(document: Any) -> str:
+    """Generate Markdown with embedded page number annotations.
 
-def _extract_page_number(element: Any) -> int | None:
-    """Extract page number from element provenance.
+    This implements custom post-processing to preserve page provenance
+    since default export_to_markdown() strips this information.
 
     Args:
-        element: Document element with potential provenance data
+        document: DoclingDocument object from conversion
 
     Returns:
-        Page number or None if not available
+        Markdown string with page markers embedded
     """
-    if not hasattr(element, "prov") or not element.prov:
-        return None
+    return "".join(iter_page_annotated_markdown(document))
 
-    for prov in element.prov:
-        if hasattr(prov, "page_no"):
-            return prov.page_no
 
-    return None
+def _text_to_markdown(element: Any) -> str:
+    return element.text + "\n"
 
 
-def _element_to_markdown(element: Any) -> str:
-    """Convert a single document element to Markdown.
+# Heading prefixes for levels 1-6, built once instead of repeating the
+# '#' * level multiplication per header
+_HEADER_PREFIXES = tuple("#" * i + " " for i in range(1, 7))
 
-    Args:
-        element: Document element to convert
+# Code-fence openers cached per language; documents reuse a handful of
+# languages, so the cache stays small (bounded as a safety net)
+_CODE_FENCE_OPENERS: dict[str, str] = {}
 
-    Returns:
-        Markdown string representation
-    """
-    element_type = type(element).__name__
+# Interned "marker " prefixes; most lists repeat one of a few markers
+_LIST_PREFIXES: dict[str, str] = {}
 
-    if element_type == "TextItem":
-        return element.text + "\n"
 
-    elif element_type == "SectionHeaderItem":
-        level = getattr(element, "level", 1)
-        return f"{'#' * level} {element.text}\n"
+def _section_header_to_markdown(element: Any) -> str:
+    # Clamp to Markdown's six heading levels and index branchlessly; out-of-
+    # range levels (docling occasionally reports 0 or 7+) snap to the edge
+    level = getattr(element, "level", 1)
+    return _HEADER_PREFIXES[min(max(level, 1), 6) - 1] + element.text + "\n"
+
 
-    elif element_type == "ListItem":
-        marker = getattr(element, "marker", "-")
-        return f"{marker} {element.text}\n"
+def _list_item_to_markdown(element: Any) -> str:
+    marker = getattr(element, "marker", "-")
+    prefix = _LIST_PREFIXES.get(marker)
+    if prefix is None:
+        prefix = sys.intern(marker + " ")
+        if len(_LIST_PREFIXES) < 32:
+            _LIST_PREFIXES[marker] = prefix
+    return prefix + element.text + "\n"
 
-    elif element_type == "TableItem":
-        return _table_to_markdown(element)
 
-    elif element_type == "CodeItem":
-        lang = getattr(element, "language", "")
-        return f"```{lang}\n{element.text}\n```\n"
+def _code_to_markdown(element: Any) -> str:
+    lang = getattr(element, "language", "")
+    opener = _CODE_FENCE_OPENERS.get(lang)
+    if opener is None:
+        opener = f"```{lang}\n"
+        if len(_CODE_FENCE_OPENERS) < 64:
+            _CODE_FENCE_OPENERS[lang] = opener
+    return opener + element.text + "\n```\n"
 
-    elif element_type == "FormulaItem":
-        # LaTeX formula
-        return f"$$\n{element.text}\n$$\n"
 
-    elif element_type == "PictureItem":
-        caption = getattr(element, "caption", "Image")
-        return f"![{caption}]()\n"
+def _formula_to_markdown(element: Any) -> str:
+    # LaTeX formula
+    return f"$$\n{element.text}\n$$\n"
 
-    else:
-        # Fallback for unknown types
-        if hasattr(element, "text"):
-            return element.text + "\n"
+
+def _picture_to_markdown(element: Any) -> str:
+    caption = getattr(element, "caption", "Image")
+    return f"![{caption}]()\n"
+
+
+def _fallback_to_markdown(element: Any) -> str:
+    # Fallback for unknown types; most carry text, so probe by exception
+    try:
+        return element.text + "\n"
+    except AttributeError:
         return ""
 
 
@@ -113,10 +163,16 @@ def _table_to_markdown(table_element: Any) -> str:
     Returns:
         Markdown table string
     """
-    if not hasattr(table_element, "data") or not table_element.data:
+    # Real TableItems always have .data, so probe by exception instead of a
+    # hasattr walk plus a second attribute read
+    try:
+        data = table_element.data
+    except AttributeError:
+        return ""
+    if not data:
         return ""
 
-    grid = getattr(table_element.data, "grid", None)
+    grid = getattr(data, "grid", None)
     if not grid:
         return ""
 
@@ -124,21 +180,19 @@ def _table_to_markdown(table_element: Any) -> str:
     if not rows:
         return ""
 
-    md_lines = []
+    # Local bindings skip the global/method lookups in the per-cell loop
+    _gct = _get_cell_text
+    pipe_join = " | ".join
 
-    # Header row
-    if rows:
-        header = rows[0]
-        header_cells = [_get_cell_text(cell) for cell in header]
-        md_lines.append("| " + " | ".join(header_cells) + " |")
-        md_lines.append("| " + " | ".join("---" for _ in header) + " |")
+    # Header row, separator, then all data rows in one comprehension and a
+    # single join; avoids growing a lines list row by row
+    header = rows[0]
+    header_line = f"| {pipe_join(_gct(cell) for cell in header)} |"
+    # String repetition builds the separator without iterating the header
+    sep = "|" + " --- |" * len(header)
+    body = [f"| {pipe_join(_gct(cell) for cell in row)} |" for row in rows[1:]]
 
-    # Data rows
-    for row in rows[1:]:
-        row_cells = [_get_cell_text(cell) for cell in row]
-        md_lines.append("| " + " | ".join(row_cells) + " |")
-
-    return "\n".join(md_lines) + "\n"
+    return "\n".join([header_line, sep, *body]) + "\n"
 
 
 def _get_cell_text(cell: Any) -> str:
@@ -150,6 +204,49 @@ def _get_cell_text(cell: Any) -> str:
     Returns:
         Cell text as string
     """
-    if hasattr(cell, "text"):
-        return str(cell.text)
-    return str(cell)
+    # Single getattr with default instead of a hasattr walk plus a second
+    # attribute read; falls back to the cell itself when there is no text
+    return str(getattr(cell, "text", cell))
+
+
+# Class-name dispatch table: one hash lookup per element instead of walking
+# an if/elif chain of string comparisons
+_HANDLERS_BY_NAME = {
+    "TextItem": _text_to_markdown,
+    "SectionHeaderItem": _section_header_to_markdown,
+    "ListItem": _list_item_to_markdown,
+    "TableItem": _table_to_markdown,
+    "CodeItem": _code_to_markdown,
+    "FormulaItem": _formula_to_markdown,
+    "PictureItem": _picture_to_markdown,
+}
+
+# Memoized per-class resolution of the name table, filled on first sight of
+# each element class
+_HANDLERS_BY_TYPE: dict[type, Callable[[Any], str]] = {}
+
+
+def _element_to_markdown(
+    element: Any,
+    # Default-arg bindings: resolved once at def time so the per-element
+    # body runs on LOAD_FAST instead of LOAD_GLOBAL lookups
+    _type: Any = type,
+    _by_type_get: Any = _HANDLERS_BY_TYPE.get,
+    _by_name_get: Any = _HANDLERS_BY_NAME.get,
+) -> str:
+    """Convert a single document element to Markdown.
+
+    Args:
+        element: Document element to convert
+
+    Returns:
+        Markdown string representation
+    """
+    # Key on the class itself; the name-based lookup runs once per class and
+    # later elements of the same type hit a pointer-hash dict get
+    element_type = _type(element)
+    handler = _by_type_get(element_type)
+    if handler is None:
+        handler = _by_name_get(element_type.__name__, _fallback_to_markdown)
+        _HANDLERS_BY_TYPE[element_type] = handler
+    return handler(element)
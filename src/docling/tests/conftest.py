@@ -1,11 +1,9 @@
 """Pytest configuration and fixtures for Docling service tests."""
 
-import os
 import tempfile
+from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncGenerator, Generator
-from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import FastAPI
@@ -47,13 +45,13 @@ def temp_folder() -> Generator[Path, None, None]:
         yield Path(tmp)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_token() -> str:
     """Return test authentication token."""
     return "test-auth-token-12345"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_headers(auth_token: str) -> dict:
     """Return authentication headers for API requests."""
     return {"Authorization": f"Bearer {auth_token}"}
@@ -71,13 +69,13 @@ def trace_headers(trace_id: str) -> dict:
     return {"X-Trace-Id": trace_id}
 
 
-def create_test_app(auth_token: str) -> FastAPI:
+def create_test_app(_auth_token: str) -> FastAPI:
     """Create a test-friendly FastAPI app without async lifespan issues."""
     from docling_service.api.routes import router
 
     # Create app without the problematic lifespan that starts workers
     @asynccontextmanager
-    async def test_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    async def test_lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
         """Minimal lifespan for testing - no background workers."""
         yield
 
@@ -101,23 +99,46 @@ def create_test_app(auth_token: str) -> FastAPI:
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_client(auth_token: str) -> Generator[TestClient, None, None]:
-    """Create a test client for the FastAPI application."""
-    # Set environment variables before importing the app
-    os.environ["DOCLING_AUTH_TOKEN"] = auth_token
-    os.environ["DOCLING_HOST"] = "127.0.0.1"
-    os.environ["DOCLING_PORT"] = "8765"
-    os.environ["DOCLING_PROCESSING_TIER"] = "standard"
+    """Create a test client for the FastAPI application.
+
+    Session-scoped: app construction, middleware wiring, and the settings
+    reload are identical for every test, so they run once per suite
+    instead of once per test.
+    """
+    # monkeypatch itself is function-scoped, so use an explicit context to
+    # set the environment for the lifetime of the session client
+    with pytest.MonkeyPatch.context() as mp:
+        # Set environment variables before importing the app
+        mp.setenv("DOCLING_AUTH_TOKEN", auth_token)
+        mp.setenv("DOCLING_HOST", "127.0.0.1")
+        mp.setenv("DOCLING_PORT", "8765")
+        mp.setenv("DOCLING_PROCESSING_TIER", "standard")
 
-    # Reload settings to pick up env vars
-    from docling_service.core import config
-    config.settings = config.Settings()
+        # Reload settings to pick up env vars (cached on the env fingerprint)
+        from docling_service.core import config
+        config.settings = config.get_settings()
 
-    app = create_test_app(auth_token)
+        app = create_test_app(auth_token)
 
-    with TestClient(app) as client:
-        yield client
+        with TestClient(app) as client:
+            yield client
+
+
+@pytest.fixture(scope="class")
+def submitted_job_id(api_client: TestClient, auth_headers: dict) -> str:
+    """Submit one job and share its id across a test class.
+
+    Read-only tests (status, listing) don't need a job each; tests that
+    mutate the job (e.g. cancel) should submit their own.
+    """
+    response = api_client.post(
+        "/api/v1/process",
+        json={"file_path": "/tmp/test.pdf"},
+        headers=auth_headers,
+    )
+    return response.json()["job_id"]
 
 
 @pytest.fixture
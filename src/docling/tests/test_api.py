@@ -4,10 +4,7 @@ These tests validate the API contract as defined in openapi.yaml.
 They test endpoint structure, request/response schemas, and error handling.
 """
 
-import os
 import uuid
-from pathlib import Path
-from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import status
@@ -136,6 +133,26 @@ class TestProcessEndpoint:
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
+    def test_process_relative_path_rejected(self, api_client, auth_headers):
+        """Process endpoint should reject relative file paths."""
+        response = api_client.post(
+            "/api/v1/process",
+            json={"file_path": "relative/test.pdf"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_process_unsupported_suffix_rejected(self, api_client, auth_headers):
+        """Process endpoint should reject unsupported file types."""
+        response = api_client.post(
+            "/api/v1/process",
+            json={"file_path": "/tmp/test.exe"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_process_invalid_tier(self, api_client, auth_headers):
         """Process endpoint should reject invalid processing_tier."""
         response = api_client.post(
@@ -155,14 +172,14 @@ class TestJobStatusEndpoint:
 
     def test_get_job_requires_auth(self, api_client):
         """Job status endpoint should require authentication."""
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         response = api_client.get(f"/api/v1/jobs/{job_id}")
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_get_job_not_found(self, api_client, auth_headers):
         """Job status endpoint should return 404 for unknown job."""
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         response = api_client.get(
             f"/api/v1/jobs/{job_id}",
             headers=auth_headers,
@@ -172,15 +189,9 @@ class TestJobStatusEndpoint:
         data = response.json()
         assert "detail" in data
 
-    def test_get_job_after_submit(self, api_client, auth_headers):
+    def test_get_job_after_submit(self, api_client, auth_headers, submitted_job_id):
         """Job status should be retrievable after submission."""
-        # Submit a job
-        submit_response = api_client.post(
-            "/api/v1/process",
-            json={"file_path": "/tmp/test.pdf"},
-            headers=auth_headers,
-        )
-        job_id = submit_response.json()["job_id"]
+        job_id = submitted_job_id
 
         # Get job status
         response = api_client.get(
@@ -218,15 +229,9 @@ class TestListJobsEndpoint:
         data = response.json()
         assert isinstance(data, list)
 
-    def test_list_jobs_includes_submitted(self, api_client, auth_headers):
+    def test_list_jobs_includes_submitted(self, api_client, auth_headers, submitted_job_id):
         """List jobs should include submitted jobs."""
-        # Submit a job
-        submit_response = api_client.post(
-            "/api/v1/process",
-            json={"file_path": "/tmp/test.pdf"},
-            headers=auth_headers,
-        )
-        job_id = submit_response.json()["job_id"]
+        job_id = submitted_job_id
 
         # List jobs
         response = api_client.get("/api/v1/jobs", headers=auth_headers)
@@ -241,13 +246,13 @@ class TestCancelJobEndpoint:
 
     def test_cancel_job_requires_auth(self, api_client):
         """Cancel job endpoint should require authentication."""
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         response = api_client.delete(f"/api/v1/jobs/{job_id}")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_cancel_job_not_found(self, api_client, auth_headers):
         """Cancel job should return 404 for unknown job."""
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         response = api_client.delete(
             f"/api/v1/jobs/{job_id}",
             headers=auth_headers,
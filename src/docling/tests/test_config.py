@@ -4,8 +4,6 @@ import os
 import tempfile
 from pathlib import Path
 
-import pytest
-
 from docling_service.core.config import Settings, calculate_timeout
 
 
@@ -5,9 +5,8 @@ document processing logic.
 """
 
 import asyncio
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -17,13 +16,17 @@ class TestCreateConverter:
 
     @pytest.fixture(autouse=True)
     def mock_docling(self):
-        """Mock Docling imports to avoid import errors without docling installed."""
+        """Stub Docling imports to avoid import errors without docling installed.
+
+        SimpleNamespace stubs instead of MagicMock: attribute access is a
+        plain slot read rather than a child-mock allocation.
+        """
         mock_modules = {
-            "docling": MagicMock(),
-            "docling.datamodel": MagicMock(),
-            "docling.datamodel.base_models": MagicMock(),
-            "docling.datamodel.pipeline_options": MagicMock(),
-            "docling.document_converter": MagicMock(),
+            "docling": SimpleNamespace(),
+            "docling.datamodel": SimpleNamespace(),
+            "docling.datamodel.base_models": SimpleNamespace(),
+            "docling.datamodel.pipeline_options": SimpleNamespace(),
+            "docling.document_converter": SimpleNamespace(),
         }
 
         with patch.dict("sys.modules", mock_modules):
@@ -31,7 +34,7 @@ class TestCreateConverter:
 
     def test_lightweight_tier_no_table_structure(self):
         """Lightweight tier should disable table structure extraction."""
-        with patch.dict("sys.modules", {"docling": MagicMock()}):
+        with patch.dict("sys.modules", {"docling": SimpleNamespace()}):
             from docling_service.core.converter import create_converter
 
             # This would actually require docling to be installed
@@ -57,6 +60,31 @@ class TestCreateConverter:
         pass
 
 
+class TestGetConverter:
+    """Tests for the cached get_converter factory."""
+
+    @pytest.mark.asyncio
+    async def test_converter_cached_across_calls(self, monkeypatch):
+        """Repeated calls for one configuration build the converter once."""
+        from docling_service.core import converter
+
+        build_calls = 0
+
+        def fake_create_converter(*_args, **_kwargs):
+            nonlocal build_calls
+            build_calls += 1
+            return MagicMock()
+
+        monkeypatch.setattr(converter, "create_converter", fake_create_converter)
+        monkeypatch.setattr(converter, "_CONVERTERS", {})
+
+        first = await converter.get_converter("standard")
+        second = await converter.get_converter("standard")
+
+        assert first is second
+        assert build_calls == 1
+
+
 class TestProcessDocument:
     """Tests for process_document async function."""
 
@@ -95,6 +123,123 @@ class TestProcessDocument:
         """Should use processing_tier from options if provided."""
         pass
 
+    @pytest.mark.asyncio
+    async def test_does_not_block_loop(self, monkeypatch):
+        """A slow synchronous convert must not stall other coroutines."""
+        import time
+
+        from docling_service.core import converter
+
+        mock_modules = {
+            "docling": MagicMock(),
+            "docling.datamodel": MagicMock(),
+            "docling.datamodel.base_models": MagicMock(),
+        }
+
+        events = []
+
+        with patch.dict("sys.modules", mock_modules):
+            base_models = mock_modules["docling.datamodel.base_models"]
+            mock_result = MagicMock()
+            mock_result.status = base_models.ConversionStatus.SUCCESS
+            mock_result.document.pages = [MagicMock()]
+            mock_result.document.export_to_markdown.return_value = "# ok\n"
+
+            def slow_convert(_path):
+                time.sleep(0.2)
+                events.append("convert_done")
+                return mock_result
+
+            mock_conv = MagicMock()
+            mock_conv.convert.side_effect = slow_convert
+
+            async def fake_get_converter(*_args, **_kwargs):
+                return mock_conv
+
+            monkeypatch.setattr(converter, "get_converter", fake_get_converter)
+
+            async def tick():
+                await asyncio.sleep(0.05)
+                events.append("tick")
+
+            result, _ = await asyncio.gather(
+                converter.process_document("/tmp/test.pdf"),
+                tick(),
+            )
+
+        assert result["status"] == "success"
+        # The tick ran while convert slept in a worker thread
+        assert events.index("tick") < events.index("convert_done")
+
+
+class TestProcessDocuments:
+    """Tests for the process_documents batch entrypoint."""
+
+    @pytest.mark.asyncio
+    async def test_batch_concurrency_limit(self, monkeypatch):
+        """Batch processing should never exceed max_concurrency in flight."""
+        from docling_service.core import converter
+
+        active = 0
+        peak = 0
+
+        async def fake_process_document(file_path, **_kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return {"status": "success", "file_path": file_path}
+
+        monkeypatch.setattr(converter, "process_document", fake_process_document)
+
+        paths = [f"/tmp/test{i}.pdf" for i in range(10)]
+        results = await converter.process_documents(paths, max_concurrency=2)
+
+        assert len(results) == 10
+        assert peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_batch_preserves_order(self, monkeypatch):
+        """Results should line up with the input path order."""
+        from docling_service.core import converter
+
+        async def fake_process_document(file_path, **_kwargs):
+            return {"status": "success", "file_path": file_path}
+
+        monkeypatch.setattr(converter, "process_document", fake_process_document)
+
+        paths = [f"/tmp/test{i}.pdf" for i in range(5)]
+        results = await converter.process_documents(paths)
+
+        assert [r["file_path"] for r in results] == paths
+
+    @pytest.mark.asyncio
+    async def test_batch_priority_caps_concurrency(self, monkeypatch):
+        """Batch priority should cap in-flight conversions at 2."""
+        from docling_service.core import converter
+
+        active = 0
+        peak = 0
+
+        async def fake_process_document(file_path, **_kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return {"status": "success", "file_path": file_path}
+
+        monkeypatch.setattr(converter, "process_document", fake_process_document)
+
+        paths = [f"/tmp/test{i}.pdf" for i in range(10)]
+        results = await converter.process_documents(
+            paths, max_concurrency=8, queue_priority="batch"
+        )
+
+        assert len(results) == 10
+        assert peak <= 2
+
 
 class TestTimeoutCalculation:
     """Tests for timeout calculation logic."""
@@ -150,85 +295,184 @@ class TestErrorHandling:
         """Should handle processing timeout."""
         pass
 
+    def test_is_retryable_classification(self):
+        """Transient markers retry; terminal exception types never do."""
+        from docling_service.core.converter import _is_retryable
 
-class TestTierConfiguration:
-    """Tests for tier-based pipeline configuration (T037)."""
+        assert _is_retryable(RuntimeError("CUDA out of memory"))
+        assert _is_retryable(RuntimeError("model download timeout"))
+        assert not _is_retryable(ValueError("bad page structure"))
+        # Terminal types stay terminal even if the message looks transient
+        assert not _is_retryable(FileNotFoundError("/tmp/timeout.pdf"))
 
-    @pytest.fixture
-    def mock_docling_modules(self):
-        """Mock docling modules to capture configuration."""
-        mock_pipeline_options = MagicMock()
-        mock_pipeline_options.do_ocr = None
-        mock_pipeline_options.do_table_structure = None
-        mock_pipeline_options.images_scale = None
-        mock_pipeline_options.generate_page_images = None
-        mock_pipeline_options.table_structure_options = MagicMock()
-        mock_pipeline_options.accelerator_options = None
-        mock_pipeline_options.ocr_options = None
-
-        mock_pipeline_class = MagicMock(return_value=mock_pipeline_options)
-        mock_converter = MagicMock()
-        mock_converter_class = MagicMock(return_value=mock_converter)
-
-        with patch.dict(
-            "sys.modules",
-            {
-                "docling": MagicMock(),
-                "docling.datamodel": MagicMock(),
-                "docling.datamodel.base_models": MagicMock(
-                    InputFormat=MagicMock(PDF="PDF")
-                ),
-                "docling.datamodel.pipeline_options": MagicMock(
-                    PdfPipelineOptions=mock_pipeline_class,
-                    EasyOcrOptions=MagicMock(return_value=MagicMock()),
-                    AcceleratorOptions=MagicMock(return_value=MagicMock()),
-                    AcceleratorDevice=MagicMock(AUTO="AUTO"),
-                ),
-                "docling.document_converter": MagicMock(
-                    DocumentConverter=mock_converter_class,
-                    PdfFormatOption=MagicMock(),
-                ),
-            },
-        ):
-            yield mock_pipeline_options
+    @pytest.mark.asyncio
+    async def test_retries_on_transient_error(self, monkeypatch):
+        """Transient conversion failures should be retried with backoff."""
+        from docling_service.core import converter
 
-    def test_lightweight_config(self, mock_docling_modules):
-        """Lightweight tier should have minimal OCR and no table extraction."""
-        from docling_service.core.converter import create_converter
+        mock_modules = {
+            "docling": MagicMock(),
+            "docling.datamodel": MagicMock(),
+            "docling.datamodel.base_models": MagicMock(),
+        }
 
-        create_converter("lightweight")
+        with patch.dict("sys.modules", mock_modules):
+            base_models = mock_modules["docling.datamodel.base_models"]
+            mock_result = MagicMock()
+            mock_result.status = base_models.ConversionStatus.SUCCESS
+            mock_result.document.pages = [MagicMock()]
+            mock_result.document.export_to_markdown.return_value = "# ok\n"
 
-        # Verify configuration matches expected
-        assert mock_docling_modules.do_ocr is True
-        assert mock_docling_modules.do_table_structure is False
-        assert mock_docling_modules.images_scale == 1.0
-        assert mock_docling_modules.generate_page_images is False
+            mock_conv = MagicMock()
+            mock_conv.convert.side_effect = [
+                RuntimeError("CUDA out of memory"),
+                RuntimeError("model download timeout"),
+                mock_result,
+            ]
 
-    def test_standard_config(self, mock_docling_modules):
-        """Standard tier should enable table structure with cell matching."""
-        from docling_service.core.converter import create_converter
+            async def fake_get_converter(*_args, **_kwargs):
+                return mock_conv
 
-        create_converter("standard")
+            monkeypatch.setattr(converter, "get_converter", fake_get_converter)
+            # Zero the backoff base so retries run instantly in tests
+            monkeypatch.setattr(converter, "_RETRY_BASE_SECONDS", 0.0)
+
+            result = await converter.process_document("/tmp/test.pdf")
+
+        assert result["status"] == "success"
+        assert mock_conv.convert.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_terminal_error_not_retried(self, monkeypatch):
+        """Terminal failures should surface after a single attempt."""
+        from docling_service.core import converter
+
+        mock_modules = {
+            "docling": MagicMock(),
+            "docling.datamodel": MagicMock(),
+            "docling.datamodel.base_models": MagicMock(),
+        }
+
+        with patch.dict("sys.modules", mock_modules):
+            mock_conv = MagicMock()
+            mock_conv.convert.side_effect = FileNotFoundError("/tmp/missing.pdf")
+
+            async def fake_get_converter(*_args, **_kwargs):
+                return mock_conv
+
+            monkeypatch.setattr(converter, "get_converter", fake_get_converter)
+
+            result = await converter.process_document("/tmp/missing.pdf")
+
+        assert result["status"] == "error"
+        assert "File not found" in result["error"]
+        assert mock_conv.convert.call_count == 1
+
+
+@pytest.fixture(scope="class")
+def mock_docling_modules():
+    """Stub docling modules to capture configuration.
+
+    SimpleNamespace stubs instead of MagicMock trees: every attribute
+    read on a MagicMock allocates a child mock, which dominated fixture
+    cost here; the asserts only need plain attributes. Class scope keeps
+    one sys.modules patch open for all tier tests; _reset_pipeline_options
+    clears the captured attributes between tests.
+    """
+    pipeline_options = SimpleNamespace(
+        do_ocr=None,
+        do_table_structure=None,
+        images_scale=None,
+        generate_page_images=None,
+        table_structure_options=SimpleNamespace(do_cell_matching=None),
+        accelerator_options=None,
+        ocr_options=None,
+    )
+
+    with patch.dict(
+        "sys.modules",
+        {
+            "docling": SimpleNamespace(),
+            "docling.datamodel": SimpleNamespace(),
+            "docling.datamodel.base_models": SimpleNamespace(
+                InputFormat=SimpleNamespace(PDF="PDF")
+            ),
+            "docling.datamodel.pipeline_options": SimpleNamespace(
+                PdfPipelineOptions=lambda: pipeline_options,
+                EasyOcrOptions=lambda: SimpleNamespace(
+                    lang=None, force_full_page_ocr=None
+                ),
+                AcceleratorOptions=lambda **kwargs: SimpleNamespace(**kwargs),
+                AcceleratorDevice=SimpleNamespace(AUTO="AUTO"),
+            ),
+            "docling.document_converter": SimpleNamespace(
+                DocumentConverter=lambda **kwargs: SimpleNamespace(**kwargs),
+                PdfFormatOption=lambda **kwargs: SimpleNamespace(**kwargs),
+            ),
+        },
+    ):
+        yield pipeline_options
 
-        # Verify configuration matches expected
-        assert mock_docling_modules.do_ocr is True
-        assert mock_docling_modules.do_table_structure is True
-        assert mock_docling_modules.images_scale == 1.5
-        assert mock_docling_modules.generate_page_images is True
-        assert mock_docling_modules.table_structure_options.do_cell_matching is True
 
-    def test_advanced_config(self, mock_docling_modules):
-        """Advanced tier should use maximum quality settings."""
+class TestTierConfiguration:
+    """Tests for tier-based pipeline configuration (T037)."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_pipeline_options(self, mock_docling_modules):
+        """Reset the shared pipeline-options stub between tests."""
+        options = mock_docling_modules
+        options.do_ocr = None
+        options.do_table_structure = None
+        options.images_scale = None
+        options.generate_page_images = None
+        options.table_structure_options.do_cell_matching = None
+        options.accelerator_options = None
+        options.ocr_options = None
+
+    @pytest.mark.parametrize(
+        ("tier", "expected"),
+        [
+            (
+                "lightweight",
+                {
+                    "do_ocr": True,
+                    "do_table_structure": False,
+                    "images_scale": 1.0,
+                    "generate_page_images": False,
+                },
+            ),
+            (
+                "standard",
+                {
+                    "do_ocr": True,
+                    "do_table_structure": True,
+                    "images_scale": 1.5,
+                    "generate_page_images": True,
+                },
+            ),
+            (
+                "advanced",
+                {
+                    "do_ocr": True,
+                    "do_table_structure": True,
+                    "images_scale": 2.0,
+                    "generate_page_images": True,
+                },
+            ),
+        ],
+    )
+    def test_tier_config(self, mock_docling_modules, tier, expected):
+        """Each tier should set its documented pipeline options."""
         from docling_service.core.converter import create_converter
 
-        create_converter("advanced")
+        create_converter(tier)
+
+        for option, value in expected.items():
+            assert getattr(mock_docling_modules, option) == value
 
-        # Verify configuration matches expected
-        assert mock_docling_modules.do_ocr is True
-        assert mock_docling_modules.do_table_structure is True
-        assert mock_docling_modules.images_scale == 2.0
-        assert mock_docling_modules.generate_page_images is True
-        assert mock_docling_modules.table_structure_options.do_cell_matching is True
+        # Tiers with table structure also enable cell matching
+        if expected["do_table_structure"]:
+            assert mock_docling_modules.table_structure_options.do_cell_matching is True
 
     def test_easyocr_configured_last(self, mock_docling_modules):
         """EasyOCR options must be set LAST in pipeline configuration.
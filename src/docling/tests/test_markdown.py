@@ -4,9 +4,8 @@ These tests validate the markdown generation logic that preserves
 page provenance information from Docling document processing.
 """
 
-from unittest.mock import MagicMock, PropertyMock
-
-import pytest
+import functools
+from unittest.mock import MagicMock
 
 
 class MockProv:
@@ -16,6 +15,12 @@ class MockProv:
         self.page_no = page_no
 
 
+@functools.lru_cache(maxsize=32)
+def _mock_class(name: str) -> type:
+    """Return a cached dynamic class; all mocks of one type share it."""
+    return type(name, (), {})
+
+
 def create_mock_element(
     element_type: str,
     text: str,
@@ -29,8 +34,9 @@ def create_mock_element(
     This creates actual classes with the correct __name__ attribute,
     which is how the markdown generator identifies element types.
     """
-    # Create a dynamic class with the correct name
-    element_class = type(element_type, (), {})
+    # Cached dynamic class with the correct name; building a fresh class per
+    # element would allocate thousands of types in the large-document tests
+    element_class = _mock_class(element_type)
 
     # Create instance
     element = element_class()
@@ -76,29 +82,41 @@ class MockDocument:
 
 
 class TestExtractPageNumber:
-    """Tests for _extract_page_number function."""
+    """Tests for page number extraction (inlined into the generator)."""
 
     def test_extract_from_prov(self):
         """Should extract page number from element provenance."""
-        from docling_service.utils.markdown import _extract_page_number
+        from docling_service.utils.markdown import generate_page_annotated_markdown
 
         element = create_mock_element("TextItem", "test", page_no=5)
-        assert _extract_page_number(element) == 5
+        result = generate_page_annotated_markdown(MockDocument([element]))
+        assert "<!-- PAGE: 5 -->" in result
 
     def test_no_prov(self):
-        """Should return None when element has no provenance."""
-        from docling_service.utils.markdown import _extract_page_number
+        """Should emit no page marker when element has no provenance."""
+        from docling_service.utils.markdown import generate_page_annotated_markdown
 
         element = create_mock_element("TextItem", "test", page_no=None)
-        assert _extract_page_number(element) is None
+        result = generate_page_annotated_markdown(MockDocument([element]))
+        assert "<!-- PAGE:" not in result
 
     def test_empty_prov_list(self):
-        """Should return None for empty provenance list."""
-        from docling_service.utils.markdown import _extract_page_number
+        """Should emit no page marker for empty provenance list."""
+        from docling_service.utils.markdown import generate_page_annotated_markdown
 
         element = create_mock_element("TextItem", "test")
         element.prov = []
-        assert _extract_page_number(element) is None
+        result = generate_page_annotated_markdown(MockDocument([element]))
+        assert "<!-- PAGE:" not in result
+
+    def test_prov_without_page_no(self):
+        """Should fall back across prov entries lacking page_no."""
+        from docling_service.utils.markdown import generate_page_annotated_markdown
+
+        element = create_mock_element("TextItem", "test")
+        element.prov = [object(), MockProv(7)]
+        result = generate_page_annotated_markdown(MockDocument([element]))
+        assert "<!-- PAGE: 7 -->" in result
 
 
 class TestElementToMarkdown:
@@ -239,6 +257,43 @@ class TestGeneratePageAnnotatedMarkdown:
         result = generate_page_annotated_markdown(doc)
         assert result == ""
 
+    def test_single_page_fast_path(self):
+        """Documents with a one-entry pages dict get one up-front marker."""
+        from docling_service.utils.markdown import generate_page_annotated_markdown
+
+        elements = [
+            create_mock_element("TextItem", "First", page_no=4),
+            create_mock_element("TextItem", "Second", page_no=4),
+        ]
+        doc = MockDocument(elements)
+        doc.pages = {4: object()}
+
+        result = generate_page_annotated_markdown(doc)
+
+        assert result.count("<!-- PAGE:") == 1
+        assert "<!-- PAGE: 4 -->" in result
+        assert "First" in result
+        assert "Second" in result
+
+    def test_large_document_linear_time(self):
+        """50k elements should render in well under a second (O(N) assembly)."""
+        import time
+
+        from docling_service.utils.markdown import generate_page_annotated_markdown
+
+        elements = [
+            create_mock_element("TextItem", f"Paragraph {i}", page_no=i // 500 + 1)
+            for i in range(50_000)
+        ]
+        doc = MockDocument(elements)
+
+        start = time.perf_counter()
+        result = generate_page_annotated_markdown(doc)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert result.count("<!-- PAGE:") == 100
+
     def test_elements_without_page_info(self):
         """Should handle elements without page provenance."""
         from docling_service.utils.markdown import generate_page_annotated_markdown
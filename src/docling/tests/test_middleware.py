@@ -0,0 +1,79 @@
+"""Tests for the pure-ASGI TraceContextMiddleware.
+
+The middleware owns the ASGI protocol handling (raw header scan, send
+wrapper, contextvar reset) rather than delegating to Starlette, so its
+header behavior is pinned here against a minimal app.
+"""
+
+import re
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+
+from docling_service.api.middleware import TraceContextMiddleware
+
+# Dashed UUID v4 shape produced by new_trace_id()
+_UUID4_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$")
+
+
+def _build_app(with_gzip: bool = False) -> FastAPI:
+    """Build a minimal app with the middleware mounted as create_app does."""
+    app = FastAPI()
+
+    if with_gzip:
+        # Mirror create_app's pairing: GZip inside, trace context outside
+        app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    app.add_middleware(TraceContextMiddleware)
+
+    @app.get("/echo")
+    async def echo(request: Request) -> dict:
+        return {"trace_id": request.state.trace_id}
+
+    @app.get("/large")
+    async def large() -> dict:
+        # Well above GZip's minimum_size so the response gets compressed
+        return {"payload": "x" * 4096}
+
+    return app
+
+
+class TestTraceContextMiddleware:
+    """Tests for trace id extraction and response header propagation."""
+
+    def test_supplied_trace_id_echoed(self):
+        """A provided X-Trace-Id should reach the handler and the response."""
+        client = TestClient(_build_app())
+        trace_id = "550e8400-e29b-41d4-a716-446655440000"
+
+        response = client.get("/echo", headers={"X-Trace-Id": trace_id})
+
+        assert response.status_code == 200
+        assert response.headers["x-trace-id"] == trace_id
+        assert response.json()["trace_id"] == trace_id
+
+    def test_trace_id_generated_when_absent(self):
+        """Without the header a UUID v4 trace id should be generated."""
+        client = TestClient(_build_app())
+
+        response = client.get("/echo")
+
+        trace_id = response.headers["x-trace-id"]
+        assert _UUID4_RE.match(trace_id)
+        assert response.json()["trace_id"] == trace_id
+
+    def test_header_survives_gzip_pairing(self):
+        """The header must survive GZip rewriting the response start."""
+        client = TestClient(_build_app(with_gzip=True))
+        trace_id = "550e8400-e29b-41d4-a716-446655440000"
+
+        response = client.get(
+            "/large",
+            headers={"X-Trace-Id": trace_id, "Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+        assert response.headers["x-trace-id"] == trace_id
+        # Body still decodes through the compressed path
+        assert response.json()["payload"] == "x" * 4096
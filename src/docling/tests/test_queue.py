@@ -3,11 +3,15 @@
 import asyncio
 import uuid
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from docling_service.core.queue import Job, JobQueue, JobState, job_queue
+from docling_service.core.queue import Job, JobQueue, JobState
+
+# One event loop for all async tests in this module: loop construction and
+# teardown per test costs a socketpair plus epoll setup none of them need
+# repeated. Applied per class below so the sync Job tests stay unmarked.
+_module_loop = pytest.mark.asyncio(loop_scope="module")
 
 
 class TestJobDataclass:
@@ -29,7 +33,7 @@ class TestJobDataclass:
 
     def test_job_with_correlation_id(self):
         """Job should store correlation_id for batch jobs."""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
         job = Job(
             id="test-123",
             file_path="/tmp/test.pdf",
@@ -58,55 +62,143 @@ class TestJobDataclass:
         assert "created_at" in data
 
 
+class TestJobToDictCache:
+    """Tests for the memoized to_dict payload."""
+
+    def test_to_dict_cached_until_mutation(self):
+        """Repeated calls reuse one dict; field writes invalidate it."""
+        job = Job(id="t", file_path="/tmp/test.pdf", options={})
+
+        first = job.to_dict()
+        assert job.to_dict() is first
+
+        job.state = JobState.COMPLETED
+        second = job.to_dict()
+
+        assert second is not first
+        assert second["status"] == "completed"
+
+    def test_mark_completed_invalidates_cache(self):
+        """Timestamp updates must show up in the next to_dict call."""
+        job = Job(id="t", file_path="/tmp/test.pdf", options={})
+        assert job.to_dict()["completed_at"] is None
+
+        job.mark_completed(datetime.now(timezone.utc))
+
+        assert job.to_dict()["completed_at"] is not None
+
+
+class TestJobTimeout:
+    """Tests for per-job timeout resolution."""
+
+    def test_explicit_timeout_wins(self):
+        """An explicit timeout_seconds option should bypass calculation."""
+        from docling_service.core.queue import _job_timeout
+
+        job = Job(id="t", file_path="/tmp/test.pdf", options={"timeout_seconds": 42})
+        assert _job_timeout(job) == 42
+
+    def test_batch_priority_uses_longer_timeout(self):
+        """Batch-priority jobs should get 4x the calculated timeout."""
+        from docling_service.core.queue import _BATCH_TIMEOUT_MULTIPLIER, _job_timeout
+
+        standard = Job(id="s", file_path="/tmp/test.pdf", options={})
+        batch = Job(
+            id="b", file_path="/tmp/test.pdf", options={"queue_priority": "batch"}
+        )
+
+        assert _job_timeout(batch) == _job_timeout(standard) * _BATCH_TIMEOUT_MULTIPLIER
+
+
+@pytest.fixture(scope="module")
+def queue():
+    """One JobQueue shared by the module; reset() runs between tests.
+
+    Constructing a queue allocates an asyncio.Queue plus bookkeeping dicts;
+    sharing one instance and clearing state is cheaper than a fresh build
+    per test.
+    """
+    return JobQueue()
+
+
+@pytest.fixture(autouse=True)
+def _reset_queue(queue):
+    """Clear shared queue state after every test."""
+    yield
+    queue.reset()
+
+
 class TestJobQueueBatchHandling:
     """Tests for batch job queue handling (T053)."""
 
-    @pytest.fixture
-    def queue(self):
-        """Create a fresh job queue for testing."""
-        return JobQueue()
+    pytestmark = _module_loop
 
-    @pytest.mark.asyncio
     async def test_enqueue_with_correlation_id(self, queue):
         """Enqueue should store correlation_id for batch tracking."""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
 
-        job_id = await queue.enqueue(
+        # enqueue_and_return hands back the Job directly; correlation_id is
+        # not in to_dict() output, so the object is the only place to read it
+        job = await queue.enqueue_and_return(
             file_path="/tmp/test.pdf",
             correlation_id=correlation_id,
         )
 
-        job_data = queue.get_job(job_id)
-        # Note: correlation_id is not in to_dict() output but stored in Job
-        job = queue._jobs.get(job_id)
         assert job.correlation_id == correlation_id
 
-    @pytest.mark.asyncio
+    async def test_reset_clears_state(self, queue):
+        """reset() should drop jobs, index entries and pending queue items."""
+        correlation_id = uuid.uuid4().hex
+        await queue.enqueue(file_path="/tmp/test.pdf", correlation_id=correlation_id)
+
+        queue.reset()
+
+        assert queue.list_jobs() == []
+        assert queue.size() == 0
+        assert queue.get_by_correlation_id(correlation_id) == []
+
     async def test_batch_enqueue_same_correlation(self, queue):
         """Multiple batch jobs should share the same correlation_id."""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
         file_paths = ["/tmp/test1.pdf", "/tmp/test2.pdf", "/tmp/test3.pdf"]
 
-        job_ids = []
-        for path in file_paths:
-            job_id = await queue.enqueue(
-                file_path=path,
-                correlation_id=correlation_id,
-            )
-            job_ids.append(job_id)
+        job_ids = await queue.enqueue_many(file_paths, correlation_id=correlation_id)
 
         # Verify all jobs have same correlation_id
         for job_id in job_ids:
-            job = queue._jobs.get(job_id)
+            job = queue.get_job_obj(job_id)
             assert job.correlation_id == correlation_id
 
         # Verify we got 3 different job IDs
         assert len(set(job_ids)) == 3
 
-    @pytest.mark.asyncio
+    async def test_concurrent_enqueues(self, queue):
+        """Gathered enqueues must produce distinct, fully registered jobs."""
+        correlation_id = uuid.uuid4().hex
+
+        job_ids = await asyncio.gather(
+            *(
+                queue.enqueue(
+                    file_path=f"/tmp/test{i}.pdf", correlation_id=correlation_id
+                )
+                for i in range(10)
+            )
+        )
+
+        assert len(set(job_ids)) == 10
+        assert queue.size() == 10
+        assert len(queue.get_by_correlation_id(correlation_id)) == 10
+
+    async def test_batch_jobs_share_one_timestamp(self, queue):
+        """enqueue_many stamps the whole batch with a single created_at."""
+        job_ids = await queue.enqueue_many(["/tmp/a.pdf", "/tmp/b.pdf"])
+
+        jobs = [queue.get_job_obj(job_id) for job_id in job_ids]
+        assert jobs[0].created_at == jobs[1].created_at
+
     async def test_queue_size_increases_with_batch(self, queue):
         """Queue size should reflect batch job count."""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
 
         assert queue.size() == 0
 
@@ -119,58 +211,43 @@ class TestJobQueueBatchHandling:
         await queue.enqueue(file_path="/tmp/test3.pdf", correlation_id=correlation_id)
         assert queue.size() == 3
 
-    @pytest.mark.asyncio
     async def test_list_jobs_includes_batch(self, queue):
         """List jobs should include all batch jobs."""
-        correlation_id = str(uuid.uuid4())
-        job_ids = []
-
-        for i in range(3):
-            job_id = await queue.enqueue(
-                file_path=f"/tmp/test{i}.pdf",
-                correlation_id=correlation_id,
-            )
-            job_ids.append(job_id)
+        correlation_id = uuid.uuid4().hex
+        job_ids = await queue.enqueue_many(
+            [f"/tmp/test{i}.pdf" for i in range(3)],
+            correlation_id=correlation_id,
+        )
 
-        jobs = queue.list_jobs()
+        # Ids only: no per-job dict materialization needed for this check
+        listed_ids = queue.list_job_ids()
 
-        assert len(jobs) == 3
-        listed_ids = [job["job_id"] for job in jobs]
+        assert len(listed_ids) == 3
         for job_id in job_ids:
             assert job_id in listed_ids
 
-    @pytest.mark.asyncio
     async def test_cancel_one_batch_job(self, queue):
         """Cancelling one batch job should not affect others."""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
 
-        job1_id = await queue.enqueue(file_path="/tmp/test1.pdf", correlation_id=correlation_id)
-        job2_id = await queue.enqueue(file_path="/tmp/test2.pdf", correlation_id=correlation_id)
-        job3_id = await queue.enqueue(file_path="/tmp/test3.pdf", correlation_id=correlation_id)
+        job1 = await queue.enqueue_and_return(file_path="/tmp/test1.pdf", correlation_id=correlation_id)
+        job2 = await queue.enqueue_and_return(file_path="/tmp/test2.pdf", correlation_id=correlation_id)
+        job3 = await queue.enqueue_and_return(file_path="/tmp/test3.pdf", correlation_id=correlation_id)
 
         # Cancel job2
-        cancelled = await queue.cancel(job2_id)
+        cancelled = await queue.cancel(job2.id)
         assert cancelled is True
 
-        # Check states
-        job1 = queue._jobs.get(job1_id)
-        job2 = queue._jobs.get(job2_id)
-        job3 = queue._jobs.get(job3_id)
-
         assert job1.state == JobState.QUEUED
         assert job2.state == JobState.CANCELLED
         assert job3.state == JobState.QUEUED
 
-    @pytest.mark.asyncio
     async def test_batch_jobs_different_trace_ids(self, queue):
         """Each batch job should get its own trace_id if not provided."""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
 
-        job1_id = await queue.enqueue(file_path="/tmp/test1.pdf", correlation_id=correlation_id)
-        job2_id = await queue.enqueue(file_path="/tmp/test2.pdf", correlation_id=correlation_id)
-
-        job1 = queue._jobs.get(job1_id)
-        job2 = queue._jobs.get(job2_id)
+        job1 = await queue.enqueue_and_return(file_path="/tmp/test1.pdf", correlation_id=correlation_id)
+        job2 = await queue.enqueue_and_return(file_path="/tmp/test2.pdf", correlation_id=correlation_id)
 
         # Each job should have a trace_id (auto-generated)
         assert job1.trace_id is not None
@@ -178,116 +255,168 @@ class TestJobQueueBatchHandling:
         # Trace IDs should be different since not provided
         assert job1.trace_id != job2.trace_id
 
-    @pytest.mark.asyncio
     async def test_batch_jobs_shared_trace_id(self, queue):
         """Batch jobs can share trace_id when provided."""
-        correlation_id = str(uuid.uuid4())
-        trace_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
+        trace_id = uuid.uuid4().hex
 
-        job1_id = await queue.enqueue(
+        job1 = await queue.enqueue_and_return(
             file_path="/tmp/test1.pdf",
             correlation_id=correlation_id,
             trace_id=trace_id,
         )
-        job2_id = await queue.enqueue(
+        job2 = await queue.enqueue_and_return(
             file_path="/tmp/test2.pdf",
             correlation_id=correlation_id,
             trace_id=trace_id,
         )
 
-        job1 = queue._jobs.get(job1_id)
-        job2 = queue._jobs.get(job2_id)
-
         assert job1.trace_id == trace_id
         assert job2.trace_id == trace_id
 
-    @pytest.mark.asyncio
     async def test_batch_jobs_shared_options(self, queue):
         """Batch jobs should use shared options."""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
         options = {"processing_tier": "lightweight", "languages": ["en", "fr"]}
 
-        job_ids = []
-        for i in range(3):
-            job_id = await queue.enqueue(
-                file_path=f"/tmp/test{i}.pdf",
-                options=options,
-                correlation_id=correlation_id,
-            )
-            job_ids.append(job_id)
+        job_ids = await queue.enqueue_many(
+            [f"/tmp/test{i}.pdf" for i in range(3)],
+            options=options,
+            correlation_id=correlation_id,
+        )
 
-        for job_id in job_ids:
-            job = queue._jobs.get(job_id)
+        jobs = [queue.get_job_obj(job_id) for job_id in job_ids]
+        for job in jobs:
             assert job.options["processing_tier"] == "lightweight"
             assert job.options["languages"] == ["en", "fr"]
 
+        # One dict by reference for the whole batch, not N copies
+        assert all(job.options is jobs[0].options for job in jobs[1:])
+
+
+class TestQueueShutdown:
+    """Tests for worker shutdown bookkeeping."""
+
+    pytestmark = _module_loop
+
+    async def test_stop_leaves_no_stale_sentinels(self, queue, monkeypatch):
+        """A worker mid-job at stop() must not leave its sentinel queued."""
+        from docling_service.core import queue as queue_module
+
+        release = asyncio.Event()
+
+        async def blocking_process_document(**_kwargs):
+            await release.wait()
+            return {"status": "success", "metadata": {}}
+
+        monkeypatch.setattr(queue_module, "process_document", blocking_process_document)
+        monkeypatch.setattr(queue_module.settings, "max_concurrent_jobs", 1)
+
+        await queue.start()
+        await queue.enqueue(file_path="/tmp/test.pdf")
+        while queue.active_count() == 0:  # wait for the worker to pick it up
+            await asyncio.sleep(0)
+
+        # stop() queues the sentinel while the worker is still mid-job; the
+        # worker then finishes and exits via the _running check instead of
+        # consuming it
+        stop_task = asyncio.create_task(queue.stop())
+        await asyncio.sleep(0.01)
+        release.set()
+        await stop_task
+
+        assert queue.size() == 0
+
+
+class TestJobHistoryEviction:
+    """Tests for bounded job history."""
+
+    pytestmark = _module_loop
+
+    async def test_oldest_finished_jobs_evicted(self, queue, monkeypatch):
+        """Finished jobs beyond the cap should be evicted, oldest first."""
+        from docling_service.core import queue as queue_module
+
+        monkeypatch.setattr(queue_module.settings, "max_job_history", 2)
+
+        job1 = await queue.enqueue_and_return(file_path="/tmp/test1.pdf")
+        job1.state = JobState.COMPLETED
+        job1_id = job1.id
+
+        job2_id = await queue.enqueue(file_path="/tmp/test2.pdf")
+        job3_id = await queue.enqueue(file_path="/tmp/test3.pdf")
+
+        # job1 (finished, oldest) is evicted; queued jobs stay
+        assert queue.get_job(job1_id) is None
+        assert queue.get_job(job2_id) is not None
+        assert queue.get_job(job3_id) is not None
+
+    async def test_live_jobs_never_evicted(self, queue, monkeypatch):
+        """Queued jobs should survive even when the cap is exceeded."""
+        from docling_service.core import queue as queue_module
+
+        monkeypatch.setattr(queue_module.settings, "max_job_history", 1)
+
+        job_ids = [await queue.enqueue(file_path=f"/tmp/test{i}.pdf") for i in range(3)]
+
+        # All jobs are still queued, so none may be evicted
+        for job_id in job_ids:
+            assert queue.get_job(job_id) is not None
+
 
 class TestJobQueuePartialFailureHandling:
     """Tests for partial batch failure handling (T058)."""
 
-    @pytest.fixture
-    def queue(self):
-        """Create a fresh job queue for testing."""
-        return JobQueue()
+    pytestmark = _module_loop
 
-    @pytest.mark.asyncio
     async def test_partial_batch_failure_others_still_queued(self, queue):
         """If one batch job fails immediately, others should remain queued."""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
 
-        # Queue multiple jobs
-        job1_id = await queue.enqueue(file_path="/tmp/test1.pdf", correlation_id=correlation_id)
-        job2_id = await queue.enqueue(file_path="/tmp/test2.pdf", correlation_id=correlation_id)
-        job3_id = await queue.enqueue(file_path="/tmp/test3.pdf", correlation_id=correlation_id)
+        # Queue multiple jobs, holding the Job refs directly
+        job1 = await queue.enqueue_and_return(file_path="/tmp/test1.pdf", correlation_id=correlation_id)
+        job2 = await queue.enqueue_and_return(file_path="/tmp/test2.pdf", correlation_id=correlation_id)
+        job3 = await queue.enqueue_and_return(file_path="/tmp/test3.pdf", correlation_id=correlation_id)
 
         # Simulate failure of job1
-        job1 = queue._jobs.get(job1_id)
         job1.state = JobState.FAILED
         job1.error = "File not found"
         job1.error_type = "processing_error"
 
         # Others should still be queued
-        job2 = queue._jobs.get(job2_id)
-        job3 = queue._jobs.get(job3_id)
-
         assert job2.state == JobState.QUEUED
         assert job3.state == JobState.QUEUED
 
-    @pytest.mark.asyncio
     async def test_batch_mixed_success_failure_states(self, queue):
         """Batch jobs can have mixed success/failure states."""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
 
-        job1_id = await queue.enqueue(file_path="/tmp/test1.pdf", correlation_id=correlation_id)
-        job2_id = await queue.enqueue(file_path="/tmp/test2.pdf", correlation_id=correlation_id)
-        job3_id = await queue.enqueue(file_path="/tmp/test3.pdf", correlation_id=correlation_id)
+        job1 = await queue.enqueue_and_return(file_path="/tmp/test1.pdf", correlation_id=correlation_id)
+        job2 = await queue.enqueue_and_return(file_path="/tmp/test2.pdf", correlation_id=correlation_id)
+        job3 = await queue.enqueue_and_return(file_path="/tmp/test3.pdf", correlation_id=correlation_id)
 
         # Simulate different outcomes
-        job1 = queue._jobs.get(job1_id)
         job1.state = JobState.COMPLETED
         job1.result = {"status": "success", "markdown": "# Test"}
 
-        job2 = queue._jobs.get(job2_id)
         job2.state = JobState.FAILED
         job2.error = "Processing timeout"
         job2.error_type = "timeout"
 
-        job3 = queue._jobs.get(job3_id)
         job3.state = JobState.CANCELLED
 
         # Verify each job has independent state
         jobs = queue.list_jobs()
         states = {job["job_id"]: job["status"] for job in jobs}
 
-        assert states[job1_id] == "completed"
-        assert states[job2_id] == "failed"
-        assert states[job3_id] == "cancelled"
+        assert states[job1.id] == "completed"
+        assert states[job2.id] == "failed"
+        assert states[job3.id] == "cancelled"
 
-    @pytest.mark.asyncio
     async def test_get_batch_jobs_by_correlation_id(self, queue):
         """Should be able to filter jobs by correlation_id."""
-        correlation_id_1 = str(uuid.uuid4())
-        correlation_id_2 = str(uuid.uuid4())
+        correlation_id_1 = uuid.uuid4().hex
+        correlation_id_2 = uuid.uuid4().hex
 
         # Batch 1
         await queue.enqueue(file_path="/tmp/batch1_1.pdf", correlation_id=correlation_id_1)
@@ -296,15 +425,31 @@ class TestJobQueuePartialFailureHandling:
         # Batch 2
         await queue.enqueue(file_path="/tmp/batch2_1.pdf", correlation_id=correlation_id_2)
 
-        # Filter by correlation_id (done by iterating jobs)
-        batch1_jobs = [
-            job for job in queue._jobs.values()
-            if job.correlation_id == correlation_id_1
-        ]
-        batch2_jobs = [
-            job for job in queue._jobs.values()
-            if job.correlation_id == correlation_id_2
-        ]
+        # Filter by correlation_id via the secondary index
+        batch1_jobs = queue.get_by_correlation_id(correlation_id_1)
+        batch2_jobs = queue.get_by_correlation_id(correlation_id_2)
 
         assert len(batch1_jobs) == 2
         assert len(batch2_jobs) == 1
+        assert queue.get_by_correlation_id("unknown-correlation") == []
+
+    async def test_correlation_index_pruned_on_eviction(self, queue, monkeypatch):
+        """Evicted jobs should disappear from the correlation index."""
+        import docling_service.core.queue as queue_module
+
+        correlation_id = uuid.uuid4().hex
+        jobs = [
+            await queue.enqueue_and_return(
+                file_path=f"/tmp/batch_{i}.pdf", correlation_id=correlation_id
+            )
+            for i in range(3)
+        ]
+        for job in jobs:
+            job.state = JobState.COMPLETED
+
+        # Force eviction of all three finished jobs
+        monkeypatch.setattr(queue_module.settings, "max_job_history", 0)
+        queue._evict_finished_jobs()
+
+        assert queue.get_by_correlation_id(correlation_id) == []
+        assert correlation_id not in queue._jobs_by_correlation